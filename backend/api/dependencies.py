@@ -5,37 +5,53 @@ Shared dependencies for FastAPI routes.
 Requires Python 3.11+.
 """
 
-from typing import Any
-
 from fastapi import HTTPException
 
 from graph_db.neo4j_client import Neo4jClient
 
 
-# Shared state - populated by main.py lifespan
-_state: dict[str, Any] = {}
+# Shared client - populated by main.py lifespan
+_neo4j_client: Neo4jClient | None = None
+
+# Monotonic graph version - bumped whenever a route mutates the graph
+_graph_version = 0
 
 
 def set_neo4j_client(client: Neo4jClient | None) -> None:
     """Set the shared Neo4j client instance."""
-    _state["neo4j_client"] = client
+    global _neo4j_client
+    _neo4j_client = client
 
 
 def get_neo4j_client() -> Neo4jClient | None:
     """Get the shared Neo4j client instance."""
-    return _state.get("neo4j_client")
+    return _neo4j_client
 
 
-def require_neo4j_client() -> Neo4jClient:
+async def require_neo4j_client() -> Neo4jClient:
     """
     Dependency that requires a Neo4j client.
-    
+
+    Declared async so FastAPI resolves it inline on the event loop instead
+    of dispatching a plain function to the threadpool on every request.
+
     Raises HTTPException if client is unavailable.
     """
-    client = get_neo4j_client()
+    client = _neo4j_client
     if client is None:
         raise HTTPException(
             status_code=503,
             detail="Database connection unavailable",
         )
     return client
+
+
+def get_graph_version() -> int:
+    """Get the current graph version used to key cached reads."""
+    return _graph_version
+
+
+def bump_graph_version() -> None:
+    """Invalidate cached reads after the graph has been mutated."""
+    global _graph_version
+    _graph_version += 1
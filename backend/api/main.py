@@ -10,7 +10,7 @@ from typing import Any, AsyncIterator
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from api.dependencies import set_neo4j_client, get_neo4j_client
 from graph_db.neo4j_client import Neo4jClient
@@ -57,6 +57,9 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     if client:
         await client.close()
 
+    from api.routes.graph import shutdown_parse_pool
+    shutdown_parse_pool()
+
 
 def create_app() -> FastAPI:
     """
@@ -72,6 +75,7 @@ def create_app() -> FastAPI:
         description="Interactive Hierarchical Code Visualization System",
         version=settings.app_version,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
         docs_url="/docs" if settings.is_development else None,
         redoc_url="/redoc" if settings.is_development else None,
     )
@@ -89,18 +93,19 @@ def create_app() -> FastAPI:
     @application.exception_handler(Exception)
     async def global_exception_handler(
         request: Request, exc: Exception
-    ) -> JSONResponse:
+    ) -> ORJSONResponse:
+        # exc_info already carries the message; only format it for dev responses
         logger.exception(
             "unhandled_exception",
             path=request.url.path,
             method=request.method,
-            error=str(exc),
         )
-        return JSONResponse(
+        detail = str(exc) if settings.is_development else None
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": "Internal server error",
-                "message": str(exc) if settings.is_development else "An unexpected error occurred",
+                "message": detail or "An unexpected error occurred",
             },
         )
 
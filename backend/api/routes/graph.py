@@ -5,31 +5,194 @@ REST endpoints for graph operations.
 Requires Python 3.11+.
 """
 
+import asyncio
+import os
+import re
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
+from fastapi.responses import Response, StreamingResponse
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field, TypeAdapter
 
-from api.dependencies import require_neo4j_client
+from api.dependencies import bump_graph_version, get_graph_version, require_neo4j_client
+from api.routing import ValidateJsonRoute
 from graph_db.neo4j_client import Neo4jClient
-from parser.tree_sitter_parser import TreeSitterParser
-from parser.relationship_extractor import RelationshipExtractor
-from merkle.change_detector import ChangeDetector
-from utils.logger import get_logger
+from parser.models import ModuleInfo
+from utils.cache import TTLCache
+from utils.config import get_settings
+from utils.logger import get_logger, is_debug_enabled
 
-router = APIRouter()
+if TYPE_CHECKING:
+    from merkle.change_detector import ChangeDetector
+    from parser.relationship_extractor import RelationshipExtractor
+
+router = APIRouter(route_class=ValidateJsonRoute)
 logger = get_logger("api.graph")
 
-# Shared state for parser and change detector
-_parser = TreeSitterParser()
-_change_detector = ChangeDetector()
-_relationship_extractor = RelationshipExtractor()
+# Resolved once so hot read paths skip debug call packing entirely
+_DEBUG = is_debug_enabled()
+
+# Shared state for change detection and relationship extraction. Built on
+# first use so workers that only serve reads never load tree-sitter.
+_change_detector: "ChangeDetector | None" = None
+_relationship_extractor: "RelationshipExtractor | None" = None
+# The detector's caches are not thread-safe; every call into it holds this
+# lock and runs in a worker thread
+_change_detection_lock = asyncio.Lock()
+
+# Serialized /root payloads keyed by graph version. The TTL bounds staleness
+# for writes made outside this process (e.g. the CLI scripts).
+_root_nodes_cache: TTLCache[bytes] = TTLCache(maxsize=4, ttl=30.0)
+
+# Process pool for CPU-bound file parsing - created on first use
+_parse_pool: ProcessPoolExecutor | None = None
+
+
+def _get_change_detector() -> "ChangeDetector":
+    """Get the shared change detector, creating it if needed."""
+    global _change_detector
+    if _change_detector is None:
+        from merkle.change_detector import ChangeDetector
+
+        _change_detector = ChangeDetector()
+    return _change_detector
+
+
+def _get_relationship_extractor() -> "RelationshipExtractor":
+    """Get the shared relationship extractor, creating it if needed."""
+    global _relationship_extractor
+    if _relationship_extractor is None:
+        from parser.relationship_extractor import RelationshipExtractor
+
+        _relationship_extractor = RelationshipExtractor()
+    return _relationship_extractor
+
+
+def _init_parse_worker() -> None:
+    """Load the parser when a pool worker starts rather than on its first file."""
+    from parser.tree_sitter_parser import get_parser
+
+    get_parser()
+
+
+def _parse_one(path_str: str) -> ModuleInfo:
+    """Parse a single file inside a pool worker."""
+    from parser.tree_sitter_parser import get_parser
+
+    return get_parser().parse_file(Path(path_str))
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """Get the shared parse pool, creating it if needed."""
+    global _parse_pool
+    if _parse_pool is None:
+        _parse_pool = ProcessPoolExecutor(
+            max_workers=get_settings().parser.max_workers,
+            initializer=_init_parse_worker,
+        )
+    return _parse_pool
+
+
+def shutdown_parse_pool() -> None:
+    """Shut down the parse pool (called on application shutdown)."""
+    global _parse_pool
+    if _parse_pool is not None:
+        _parse_pool.shutdown(cancel_futures=True)
+        _parse_pool = None
+
+
+@lru_cache(maxsize=1)
+def _ignore_regex() -> re.Pattern[str]:
+    """Compile the configured ignore patterns into a single alternation."""
+    patterns = get_settings().parser.ignore_patterns
+    if not patterns:
+        return re.compile(r"(?!)")  # Never matches
+    return re.compile("|".join(re.escape(p) for p in patterns))
+
+
+def _iter_python_files(
+    root: Path, ignore_re: re.Pattern[str], recursive: bool = True
+) -> Iterator[Path]:
+    """
+    Walk a directory with os.scandir, yielding Python files.
+
+    Ignored directories are pruned before descending, so their
+    contents are never stat'ed.
+
+    Args:
+        root: Directory to search
+        ignore_re: Pattern matched against each entry name
+        recursive: Whether to search subdirectories
+
+    Yields:
+        Paths of Python files that are not ignored
+    """
+    pending = [str(root)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if ignore_re.search(entry.name):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            pending.append(entry.path)
+                    elif entry.name.endswith(".py") and entry.is_file():
+                        yield Path(entry.path)
+        except OSError as e:
+            logger.warning("directory_scan_failed", error=str(e))
+
+
+def _discover_python_files(root: Path, recursive: bool) -> list[Path]:
+    """
+    Find Python files under a directory, skipping ignored paths.
+
+    Args:
+        root: Directory to search
+        recursive: Whether to search subdirectories
+
+    Returns:
+        List of Python file paths
+    """
+    return list(_iter_python_files(root, _ignore_regex(), recursive))
+
+
+async def _parse_files(paths: list[Path]) -> tuple[list[ModuleInfo], list[str]]:
+    """
+    Parse files in parallel without blocking the event loop.
+
+    Args:
+        paths: Python files to parse
+
+    Returns:
+        Tuple of (parsed modules, error messages)
+    """
+    loop = asyncio.get_running_loop()
+    pool = _get_parse_pool()
+    results = await asyncio.gather(
+        *(loop.run_in_executor(pool, _parse_one, str(path)) for path in paths),
+        return_exceptions=True,
+    )
+
+    modules: list[ModuleInfo] = []
+    errors: list[str] = []
+    for path, result in zip(paths, results, strict=True):
+        if isinstance(result, BaseException):
+            errors.append(f"{path}: {result}")
+        else:
+            modules.append(result)
+    return modules, errors
 
 
 class NodeResponse(BaseModel):
     """Response model for a graph node."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: str
     type: str
@@ -70,11 +233,15 @@ class AncestorsResponse(BaseModel):
 class ReferenceNode(BaseModel):
     """Node with relationship information."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: str
     type: str
     qualified_name: str | None = None
-    relationship_type: str
+    relationship_type: str = Field(
+        validation_alias=AliasChoices("relationship_type", "rel_type"),
+    )
     direction: str
     line_number: int | None = None
 
@@ -119,38 +286,59 @@ class UpdateResponse(BaseModel):
     nodes_removed: int = 0
 
 
+# Batch validators for Neo4j result rows (one pydantic-core call per list).
+# Built once at import and shared by every route; search.py keeps its own
+# adapter next to SearchResult.
+_NODE_ADAPTER = TypeAdapter(NodeResponse)
+_NODE_LIST_ADAPTER = TypeAdapter(list[NodeResponse])
+_REFERENCE_ADAPTER = TypeAdapter(ReferenceNode)
+_REFERENCE_LIST_ADAPTER = TypeAdapter(list[ReferenceNode])
 
-# Use require_neo4j_client directly as dependency
-get_client = require_neo4j_client
+# Neo4j label -> API node type, in priority order for multi-label nodes
+_LABEL_TO_TYPE = {
+    "Package": "package",
+    "Module": "module",
+    "Class": "class",
+    "Function": "function",
+    "Variable": "variable",
+}
 
 
+def _node_type(labels: list[str]) -> str:
+    """Map a node's Neo4j labels to its API type."""
+    return next(
+        (node_type for label, node_type in _LABEL_TO_TYPE.items() if label in labels),
+        "unknown",
+    )
+
 
 @router.get("/root", response_model=RootNodesResponse)
 async def get_root_nodes(
-    client: Neo4jClient = Depends(get_client),
-) -> RootNodesResponse:
+    client: Neo4jClient = Depends(require_neo4j_client),
+) -> Response:
     """
     Get all root-level modules.
 
     Returns top-level modules with child counts for initial graph display.
+    Responses are cached until the graph changes.
     Target latency: <100ms
     """
-    logger.debug("fetching_root_nodes")
+    cache_key = get_graph_version()
+    cached = _root_nodes_cache.get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    if _DEBUG:
+        logger.debug("fetching_root_nodes")
 
     try:
         results = await client.get_root_nodes()
-        nodes = [
-            NodeResponse(
-                id=r["id"],
-                name=r["name"],
-                type=r["type"],
-                qualified_name=r.get("qualified_name"),
-                docstring=r.get("docstring"),
-                child_count=r.get("child_count", 0),
-            )
-            for r in results
-        ]
-        return RootNodesResponse(nodes=nodes, total=len(nodes))
+        nodes = _NODE_LIST_ADAPTER.validate_python(results)
+        body = RootNodesResponse.model_construct(
+            nodes=nodes, total=len(nodes)
+        ).model_dump_json().encode()
+        _root_nodes_cache.set(cache_key, body)
+        return Response(content=body, media_type="application/json")
 
     except Exception as e:
         logger.error("get_root_nodes_failed", error=str(e))
@@ -159,7 +347,7 @@ async def get_root_nodes(
 
 class EntryPointResponse(BaseModel):
     """Response for entry point detection."""
-    
+
     entry_point: NodeResponse | None = None
     imports: list[NodeResponse] = []
     all_modules: list[NodeResponse] = []
@@ -167,36 +355,27 @@ class EntryPointResponse(BaseModel):
 
 @router.get("/entry-point", response_model=EntryPointResponse)
 async def get_entry_point(
-    client: Neo4jClient = Depends(get_client),
+    client: Neo4jClient = Depends(require_neo4j_client),
 ) -> EntryPointResponse:
     """
     Get the entry point module and its direct imports.
-    
+
     Looks for common entry points: app.py, main.py, __main__.py, run.py
     Returns the entry point with its imports for initial flow display.
     Target latency: <100ms
     """
-    logger.debug("detecting_entry_point")
-    
+    if _DEBUG:
+        logger.debug("detecting_entry_point")
+
     # Priority order for entry points
     entry_point_names = ["app", "main", "__main__", "run", "server", "wsgi", "asgi"]
-    
+
     try:
         all_modules = await client.get_root_nodes()
-        
+
         # Convert to NodeResponse
-        module_responses = [
-            NodeResponse(
-                id=r["id"],
-                name=r["name"],
-                type=r["type"],
-                qualified_name=r.get("qualified_name"),
-                docstring=r.get("docstring"),
-                child_count=r.get("child_count", 0),
-            )
-            for r in all_modules
-        ]
-        
+        module_responses = _NODE_LIST_ADAPTER.validate_python(all_modules)
+
         # Find entry point by priority
         entry_point = None
         for name in entry_point_names:
@@ -206,35 +385,30 @@ async def get_entry_point(
                     break
             if entry_point:
                 break
-        
+
         # If no common entry point, use the one with most connections or children
         if not entry_point and module_responses:
             # Sort by child count (most complex first) as a heuristic
             sorted_modules = sorted(module_responses, key=lambda m: m.child_count, reverse=True)
             entry_point = sorted_modules[0]
-        
+
         # Get imports/connections for the entry point
-        imports = []
+        imports: list[NodeResponse] = []
         if entry_point:
             try:
                 refs = await client.get_node_references(entry_point.id)
-                for ref in refs:
-                    if ref.get("rel_type") in ("IMPORTS", "CALLS"):
-                        imports.append(NodeResponse(
-                            id=ref["id"],
-                            name=ref["name"],
-                            type=ref["type"],
-                            qualified_name=ref.get("qualified_name"),
-                        ))
+                imports = _NODE_LIST_ADAPTER.validate_python(
+                    [ref for ref in refs if ref.get("rel_type") in ("IMPORTS", "CALLS")]
+                )
             except Exception:
                 pass  # No references, that's fine
-        
+
         return EntryPointResponse(
             entry_point=entry_point,
             imports=imports,
             all_modules=module_responses,
         )
-        
+
     except Exception as e:
         logger.error("get_entry_point_failed", error=str(e))
         raise HTTPException(status_code=500, detail=str(e))
@@ -242,7 +416,7 @@ async def get_entry_point(
 
 class ConnectionNode(BaseModel):
     """Node connected via CALLS/IMPORTS/INHERITS."""
-    
+
     id: str
     name: str
     type: str
@@ -253,7 +427,7 @@ class ConnectionNode(BaseModel):
 
 class ExpandResponse(BaseModel):
     """Response for node expansion (incremental loading)."""
-    
+
     node: NodeResponse | None = None
     children: list[NodeResponse] = []
     outgoing: list[ConnectionNode] = []
@@ -262,34 +436,29 @@ class ExpandResponse(BaseModel):
 @router.get("/expand/{node_id:path}", response_model=ExpandResponse)
 async def expand_node(
     node_id: str,
-    client: Neo4jClient = Depends(get_client),
+    client: Neo4jClient = Depends(require_neo4j_client),
 ) -> ExpandResponse:
     """
     Expand a node to get its children and outgoing connections.
-    
+
     Used for incremental graph loading - returns only direct connections.
     Target latency: <50ms
     """
-    logger.debug("expanding_node", node_id=node_id)
-    
+    if _DEBUG:
+        logger.debug("expanding_node", node_id=node_id)
+
     try:
         result = await client.expand_node(node_id)
-        
+
         if not result["node"]:
             raise HTTPException(status_code=404, detail="Node not found")
-        
+
         node_data = result["node"]
-        labels = node_data.get("labels", [])
-        node_type = "package" if "Package" in labels else \
-                    "module" if "Module" in labels else \
-                    "class" if "Class" in labels else \
-                    "function" if "Function" in labels else \
-                    "variable" if "Variable" in labels else "unknown"
-        
+
         node = NodeResponse(
             id=node_data.get("id", ""),
             name=node_data.get("name", ""),
-            type=node_type,
+            type=_node_type(node_data.get("labels", [])),
             qualified_name=node_data.get("qualified_name"),
             line_number=node_data.get("line_number"),
             docstring=node_data.get("docstring"),
@@ -297,21 +466,9 @@ async def expand_node(
             is_async=node_data.get("is_async"),
             complexity=node_data.get("complexity"),
         )
-        
-        children = [
-            NodeResponse(
-                id=c["id"],
-                name=c["name"],
-                type=c["type"].lower() if c["type"] else "unknown",
-                qualified_name=c.get("qualified_name"),
-                line_number=c.get("line_number"),
-                docstring=c.get("docstring"),
-                is_async=c.get("is_async"),
-                complexity=c.get("complexity"),
-            )
-            for c in result["children"]
-        ]
-        
+
+        children = _NODE_LIST_ADAPTER.validate_python(result["children"])
+
         outgoing = [
             ConnectionNode(
                 id=o["target_id"],
@@ -321,9 +478,9 @@ async def expand_node(
             )
             for o in result["outgoing"]
         ]
-        
+
         return ExpandResponse(node=node, children=children, outgoing=outgoing)
-    
+
     except HTTPException:
         raise
     except Exception as e:
@@ -334,7 +491,7 @@ async def expand_node(
 @router.get("/node/{node_id}", response_model=NodeResponse)
 async def get_node(
     node_id: str,
-    client: Neo4jClient = Depends(get_client),
+    client: Neo4jClient = Depends(require_neo4j_client),
 ) -> NodeResponse:
     """
     Get a single node by ID.
@@ -342,40 +499,16 @@ async def get_node(
     Returns full node details.
     Target latency: <50ms
     """
-    logger.debug("fetching_node", node_id=node_id)
+    if _DEBUG:
+        logger.debug("fetching_node", node_id=node_id)
 
     try:
         result = await client.get_node_by_id(node_id)
         if not result:
             raise HTTPException(status_code=404, detail="Node not found")
 
-        labels = result.get("labels", [])
-        node_type = "unknown"
-        if "Package" in labels:
-            node_type = "package"
-        elif "Module" in labels:
-            node_type = "module"
-        elif "Class" in labels:
-            node_type = "class"
-        elif "Function" in labels:
-            node_type = "function"
-        elif "Variable" in labels:
-            node_type = "variable"
-
-        return NodeResponse(
-            id=result["id"],
-            name=result.get("name", ""),
-            type=node_type,
-            qualified_name=result.get("qualified_name"),
-            line_number=result.get("line_number"),
-            docstring=result.get("docstring"),
-            child_count=result.get("child_count", 0),
-            is_async=result.get("is_async"),
-            is_method=result.get("is_method"),
-            is_abstract=result.get("is_abstract"),
-            complexity=result.get("complexity"),
-            return_type=result.get("return_type"),
-            type_hint=result.get("type_hint"),
+        return _NODE_ADAPTER.validate_python(
+            {"name": "", **result, "type": _node_type(result.get("labels", []))}
         )
 
     except HTTPException:
@@ -400,7 +533,7 @@ class PaginatedChildrenResponse(BaseModel):
 async def get_node_children(
     node_id: str,
     limit: int = Query(default=1000, ge=1, le=5000),
-    client: Neo4jClient = Depends(get_client),
+    client: Neo4jClient = Depends(require_neo4j_client),
 ) -> ChildrenResponse:
     """
     Get immediate children of a node.
@@ -409,27 +542,13 @@ async def get_node_children(
     and by line number within each type.
     Target latency: <50ms
     """
-    logger.debug("fetching_children", node_id=node_id, limit=limit)
+    if _DEBUG:
+        logger.debug("fetching_children", node_id=node_id, limit=limit)
 
     try:
-        results = await client.get_node_children(node_id)
-        children = [
-            NodeResponse(
-                id=r["id"],
-                name=r["name"],
-                type=r["type"],
-                qualified_name=r.get("qualified_name"),
-                line_number=r.get("line_number"),
-                docstring=r.get("docstring"),
-                child_count=r.get("child_count", 0),
-                is_async=r.get("is_async"),
-                is_method=r.get("is_method"),
-                is_abstract=r.get("is_abstract"),
-                complexity=r.get("complexity"),
-            )
-            for r in results[:limit]
-        ]
-        return ChildrenResponse(
+        results = await client.get_node_children(node_id, limit=limit)
+        children = _NODE_LIST_ADAPTER.validate_python(results)
+        return ChildrenResponse.model_construct(
             parent_id=node_id,
             children=children,
             total=len(children),
@@ -440,13 +559,39 @@ async def get_node_children(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/node/{node_id}/children.ndjson")
+async def stream_node_children(
+    node_id: str,
+    limit: int = Query(default=1000, ge=1, le=5000),
+    client: Neo4jClient = Depends(require_neo4j_client),
+) -> StreamingResponse:
+    """
+    Stream immediate children of a node as newline-delimited JSON.
+
+    Emits one NodeResponse object per line as rows arrive from Neo4j,
+    in the same order as /children. Intended for very large child sets.
+    """
+    if _DEBUG:
+        logger.debug("streaming_children", node_id=node_id, limit=limit)
+
+    async def stream() -> AsyncIterator[bytes]:
+        try:
+            async for row in client.get_node_children_stream(node_id, limit=limit):
+                yield _NODE_ADAPTER.dump_json(_NODE_ADAPTER.validate_python(row)) + b"\n"
+        except Exception as e:
+            # Headers are already sent, so the client sees a truncated stream
+            logger.error("stream_children_failed", node_id=node_id, error=str(e))
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
 @router.get("/node/{node_id}/children/paginated", response_model=PaginatedChildrenResponse)
 async def get_node_children_paginated(
     node_id: str,
     limit: int = Query(default=50, ge=1, le=200),
     offset: int = Query(default=0, ge=0),
     type_filter: str | None = Query(default=None, description="Filter by type: package, module, class, function, variable"),
-    client: Neo4jClient = Depends(get_client),
+    client: Neo4jClient = Depends(require_neo4j_client),
 ) -> PaginatedChildrenResponse:
     """
     Get paginated children of a node.
@@ -454,27 +599,13 @@ async def get_node_children_paginated(
     Supports filtering by node type and pagination for large hierarchies.
     Target latency: <50ms
     """
-    logger.debug("fetching_paginated_children", node_id=node_id, limit=limit, offset=offset)
+    if _DEBUG:
+        logger.debug("fetching_paginated_children", node_id=node_id, limit=limit, offset=offset)
 
     try:
         result = await client.get_children_paginated(node_id, limit=limit, offset=offset, type_filter=type_filter)
-        children = [
-            NodeResponse(
-                id=r["id"],
-                name=r["name"],
-                type=r["type"],
-                qualified_name=r.get("qualified_name"),
-                line_number=r.get("line_number"),
-                docstring=r.get("docstring"),
-                child_count=r.get("child_count", 0),
-                is_async=r.get("is_async"),
-                is_method=r.get("is_method"),
-                is_abstract=r.get("is_abstract"),
-                complexity=r.get("complexity"),
-            )
-            for r in result["children"]
-        ]
-        return PaginatedChildrenResponse(
+        children = _NODE_LIST_ADAPTER.validate_python(result["children"])
+        return PaginatedChildrenResponse.model_construct(
             parent_id=node_id,
             children=children,
             total=result["total"],
@@ -491,7 +622,7 @@ async def get_node_children_paginated(
 @router.get("/node/{node_id}/ancestors", response_model=AncestorsResponse)
 async def get_node_ancestors(
     node_id: str,
-    client: Neo4jClient = Depends(get_client),
+    client: Neo4jClient = Depends(require_neo4j_client),
 ) -> AncestorsResponse:
     """
     Get path from root to node (for breadcrumbs).
@@ -499,20 +630,13 @@ async def get_node_ancestors(
     Returns ordered list of ancestors from root to parent.
     Target latency: <30ms
     """
-    logger.debug("fetching_ancestors", node_id=node_id)
+    if _DEBUG:
+        logger.debug("fetching_ancestors", node_id=node_id)
 
     try:
         results = await client.get_node_ancestors(node_id)
-        ancestors = [
-            NodeResponse(
-                id=r["id"],
-                name=r["name"],
-                type=r["type"],
-                qualified_name=r.get("qualified_name"),
-            )
-            for r in results
-        ]
-        return AncestorsResponse(node_id=node_id, ancestors=ancestors)
+        ancestors = _NODE_LIST_ADAPTER.validate_python(results)
+        return AncestorsResponse.model_construct(node_id=node_id, ancestors=ancestors)
 
     except Exception as e:
         logger.error("get_ancestors_failed", node_id=node_id, error=str(e))
@@ -522,7 +646,7 @@ async def get_node_ancestors(
 @router.get("/node/{node_id}/references", response_model=ReferencesResponse)
 async def get_node_references(
     node_id: str,
-    client: Neo4jClient = Depends(get_client),
+    client: Neo4jClient = Depends(require_neo4j_client),
 ) -> ReferencesResponse:
     """
     Get all nodes that reference or are referenced by this node.
@@ -530,23 +654,13 @@ async def get_node_references(
     Excludes CONTAINS relationships (use /children for those).
     Target latency: <100ms
     """
-    logger.debug("fetching_references", node_id=node_id)
+    if _DEBUG:
+        logger.debug("fetching_references", node_id=node_id)
 
     try:
         results = await client.get_node_references(node_id)
-        references = [
-            ReferenceNode(
-                id=r["id"],
-                name=r["name"],
-                type=r["type"],
-                qualified_name=r.get("qualified_name"),
-                relationship_type=r["rel_type"],
-                direction=r["direction"],
-                line_number=r.get("line_number"),
-            )
-            for r in results
-        ]
-        return ReferencesResponse(
+        references = _REFERENCE_LIST_ADAPTER.validate_python(results)
+        return ReferencesResponse.model_construct(
             node_id=node_id,
             references=references,
             total=len(references),
@@ -557,11 +671,36 @@ async def get_node_references(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/node/{node_id}/references.ndjson")
+async def stream_node_references(
+    node_id: str,
+    client: Neo4jClient = Depends(require_neo4j_client),
+) -> StreamingResponse:
+    """
+    Stream related nodes as newline-delimited JSON.
+
+    Emits one ReferenceNode object per line as rows arrive from Neo4j.
+    Intended for heavily referenced nodes with thousands of callers.
+    """
+    if _DEBUG:
+        logger.debug("streaming_references", node_id=node_id)
+
+    async def stream() -> AsyncIterator[bytes]:
+        try:
+            async for row in client.get_node_references_stream(node_id):
+                yield _REFERENCE_ADAPTER.dump_json(_REFERENCE_ADAPTER.validate_python(row)) + b"\n"
+        except Exception as e:
+            # Headers are already sent, so the client sees a truncated stream
+            logger.error("stream_references_failed", node_id=node_id, error=str(e))
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
 @router.post("/parse", response_model=ParseResponse)
 async def parse_codebase(
     request: ParseRequest,
     background_tasks: BackgroundTasks,
-    client: Neo4jClient = Depends(get_client),
+    client: Neo4jClient = Depends(require_neo4j_client),
 ) -> ParseResponse:
     """
     Parse a Python codebase and populate the graph.
@@ -578,25 +717,8 @@ async def parse_codebase(
     if not codebase_path.is_dir():
         raise HTTPException(status_code=400, detail="Path must be a directory")
 
-    # Find all Python files
-    if request.recursive:
-        python_files = list(codebase_path.rglob("*.py"))
-    else:
-        python_files = list(codebase_path.glob("*.py"))
-
-    # Filter out ignored patterns
-    from utils.config import get_settings
-    settings = get_settings()
-    ignore_patterns = settings.parser.ignore_patterns
-
-    def should_ignore(path: Path) -> bool:
-        path_str = str(path)
-        for pattern in ignore_patterns:
-            if pattern in path_str:
-                return True
-        return False
-
-    python_files = [f for f in python_files if not should_ignore(f)]
+    # Find all Python files, skipping ignored patterns
+    python_files = _discover_python_files(codebase_path, request.recursive)
 
     if not python_files:
         return ParseResponse(
@@ -606,15 +728,7 @@ async def parse_codebase(
         )
 
     # Parse all files
-    modules = []
-    errors = []
-
-    for file_path in python_files:
-        try:
-            module = _parser.parse_file(file_path)
-            modules.append(module)
-        except Exception as e:
-            errors.append(f"{file_path}: {e}")
+    modules, errors = await _parse_files(python_files)
 
     if not modules:
         return ParseResponse(
@@ -623,19 +737,26 @@ async def parse_codebase(
             errors=errors,
         )
 
-    # Extract relationships
-    relationships = _relationship_extractor.extract_relationships(modules)
-
     # Store in Neo4j
     try:
         # Clear existing data (optional - could be made configurable)
         # await client.clear_database()
 
-        nodes_created = await client.bulk_create_nodes(modules)
-        rels_created = await client.bulk_create_relationships(relationships)
+        # Extract relationships in a worker thread while the nodes are written
+        extractor = _get_relationship_extractor()
+        async with asyncio.TaskGroup() as tg:
+            nodes_task = tg.create_task(client.bulk_create_nodes(modules))
+            rels_task = tg.create_task(
+                asyncio.to_thread(extractor.extract_relationships, modules)
+            )
+
+        nodes_created = nodes_task.result()
+        rels_created = await client.bulk_create_relationships(rels_task.result())
+        bump_graph_version()
 
         # Initialize change detector cache
-        _change_detector.initialize_from_modules(modules)
+        async with _change_detection_lock:
+            await asyncio.to_thread(_get_change_detector().initialize_from_modules, modules)
 
         logger.info(
             "parse_completed",
@@ -652,6 +773,8 @@ async def parse_codebase(
         )
 
     except Exception as e:
+        if isinstance(e, ExceptionGroup):
+            e = e.exceptions[0]
         logger.error("parse_storage_failed", error=str(e))
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -659,7 +782,7 @@ async def parse_codebase(
 @router.post("/update", response_model=UpdateResponse)
 async def update_changed_files(
     request: UpdateRequest,
-    client: Neo4jClient = Depends(get_client),
+    client: Neo4jClient = Depends(require_neo4j_client),
 ) -> UpdateResponse:
     """
     Update the graph for changed files.
@@ -670,27 +793,29 @@ async def update_changed_files(
     logger.info("update_requested", file_count=len(request.paths))
 
     paths = [Path(p) for p in request.paths]
-    changes = _change_detector.detect_changes_batch(paths)
+    change_detector = _get_change_detector()
+    # Hashing blocks on pool futures, so keep it off the event loop
+    async with _change_detection_lock:
+        changes = await asyncio.to_thread(
+            change_detector.detect_changes_batch, paths, _get_parse_pool()
+        )
 
     if not changes.has_changes:
         return UpdateResponse(status="no_changes", files_updated=len(paths))
 
     try:
-        # Get updated modules
-        updated_modules = [
-            _change_detector.get_module(Path(p))
-            for p in changes.affected_modules
-            if _change_detector.get_module(Path(p))
-        ]
-
-        # Delete removed nodes
-        for removed in changes.removed_nodes:
-            # Find the module path and delete
-            for path_str in changes.affected_modules:
-                path = Path(path_str)
-                if path.exists():
-                    await client.delete_module(str(path))
-                    break
+        # One cache lookup per affected path; deleted files were evicted by
+        # the change detector, so no per-path stat() is needed here
+        modules_by_path = {
+            path_str: change_detector.get_module(Path(path_str))
+            for path_str in changes.affected_modules
+        }
+        updated_modules = [m for m in modules_by_path.values() if m is not None]
+
+        # Drop affected modules in one round-trip; surviving files are
+        # re-created below and deleted files disappear from the graph
+        if changes.removed_nodes:
+            await client.bulk_delete_modules(sorted(changes.affected_modules))
 
         # Create/update nodes
         nodes_created = 0
@@ -698,9 +823,11 @@ async def update_changed_files(
             nodes_created = await client.bulk_create_nodes(updated_modules)
 
             # Re-extract and create relationships
-            relationships = _relationship_extractor.extract_relationships(updated_modules)
+            relationships = _get_relationship_extractor().extract_relationships(updated_modules)
             await client.bulk_create_relationships(relationships)
 
+        bump_graph_version()
+
         return UpdateResponse(
             status="completed",
             files_updated=len(request.paths),
@@ -715,7 +842,7 @@ async def update_changed_files(
 
 @router.delete("/clear")
 async def clear_graph(
-    client: Neo4jClient = Depends(get_client),
+    client: Neo4jClient = Depends(require_neo4j_client),
 ) -> dict[str, str]:
     """
     Clear all nodes and relationships from the graph.
@@ -726,7 +853,10 @@ async def clear_graph(
 
     try:
         await client.clear_database()
-        _change_detector.clear_cache()
+        if _change_detector is not None:
+            async with _change_detection_lock:
+                await asyncio.to_thread(_change_detector.clear_cache)
+        bump_graph_version()
         return {"status": "cleared"}
 
     except Exception as e:
@@ -741,59 +871,44 @@ async def get_project_tree(
 ) -> dict[str, Any]:
     """
     Get the full hierarchical tree of the codebase.
-    
+
     Parses the codebase in-memory and returns the nested structure
     suitable for React Flow visualization.
     """
     logger.info("tree_requested", path=path)
-    
+
     codebase_path = Path(path)
     if not codebase_path.exists():
         raise HTTPException(status_code=404, detail="Path not found")
-        
+
     try:
-        # We can reuse the existing _parser. 
+        # Parsing runs in the shared process pool.
         # Note: This does a fresh parse. For a persistent DB approach,
-        # we would query Neo4j, but fitting the Neo4j flat records back into 
-        # a tree is complex. Since tree-sitter is fast, we parse on demand 
+        # we would query Neo4j, but fitting the Neo4j flat records back into
+        # a tree is complex. Since tree-sitter is fast, we parse on demand
         # for the visualizer for now.
-        
-        # Discover files
-        if recursive:
-            files = list(codebase_path.rglob("*.py"))
-        else:
-            files = list(codebase_path.glob("*.py"))
-            
-        # Filter ignored
-        from utils.config import get_settings
-        settings = get_settings()
-        ignore_patterns = settings.parser.ignore_patterns
-        
-        files = [f for f in files if not any(p in str(f) for p in ignore_patterns)]
-        
+
+        # Discover files, skipping ignored patterns
+        files = _discover_python_files(codebase_path, recursive)
+
         if not files:
             return {"id": "root", "type": "root", "children": []}
-            
+
         # Parse
-        modules = []
-        for f in files:
-            try:
-                modules.append(_parser.parse_file(f))
-            except Exception:
-                continue
-                
+        modules, _ = await _parse_files(files)
+
         # Build Tree
         from parser.tree_builder import TreeBuilder
         from parser.models import ParseResult
-        
+
         # We pass empty relationships list as we only need structure for the tree view
         # Relationships are fetched on demand or we could add them to the tree
         result = ParseResult(modules=modules, relationships=[])
         builder = TreeBuilder(result, str(codebase_path))
         tree = builder.build()
-        
+
         return tree
-        
+
     except Exception as e:
         logger.error("tree_generation_failed", error=str(e))
         raise HTTPException(status_code=500, detail=str(e))
@@ -5,22 +5,32 @@ Search endpoints for the graph.
 Requires Python 3.11+.
 """
 
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
 from typing import Any
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query
-from pydantic import BaseModel
+from fastapi.responses import Response
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
-from api.dependencies import require_neo4j_client
+from api.dependencies import get_graph_version, require_neo4j_client
 from graph_db.neo4j_client import Neo4jClient
-from utils.logger import get_logger
+from utils.cache import TTLCache
+from utils.logger import get_logger, is_debug_enabled
 
 router = APIRouter()
 logger = get_logger("api.search")
 
+# Resolved once so hot read paths skip debug call packing entirely
+_DEBUG = is_debug_enabled()
+
 
 class SearchResult(BaseModel):
     """A single search result."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: str
     type: str
@@ -38,6 +48,50 @@ class SearchResponse(BaseModel):
     total: int
 
 
+# Batch validator for Neo4j result rows (one pydantic-core call per list)
+_SEARCH_RESULT_LIST_ADAPTER = TypeAdapter(list[SearchResult])
+
+# Serialized search/suggest payloads keyed by query arguments and graph
+# version. Search-as-you-type repeats the same prefixes heavily.
+_search_cache: TTLCache[bytes] = TTLCache(maxsize=1024, ttl=30.0)
+
+# Searches currently running, so identical concurrent requests share one query
+_inflight: dict[Hashable, asyncio.Task[bytes]] = {}
+
+
+async def _coalesced(key: Hashable, build: Callable[[], Awaitable[bytes]]) -> bytes:
+    """
+    Get a cached payload, or build it once for all concurrent callers.
+
+    Args:
+        key: Cache key identifying the payload
+        build: Coroutine factory that produces the payload on a miss
+
+    Returns:
+        Serialized response body
+    """
+    cached = _search_cache.get(key)
+    if cached is not None:
+        return cached
+
+    task = _inflight.get(key)
+    if task is None:
+
+        async def run() -> bytes:
+            try:
+                body = await build()
+                _search_cache.set(key, body)
+                return body
+            finally:
+                del _inflight[key]
+
+        task = asyncio.create_task(run())
+        _inflight[key] = task
+
+    # Shielded so one client disconnecting does not cancel the others' query
+    return await asyncio.shield(task)
+
+
 @router.get("", response_model=SearchResponse)
 async def search_nodes(
     q: str = Query(..., min_length=1, max_length=100, description="Search query"),
@@ -47,44 +101,34 @@ async def search_nodes(
         description="Filter by node type (module, class, function, variable)",
     ),
     client: Neo4jClient = Depends(require_neo4j_client),
-) -> SearchResponse:
+) -> Response:
     """
     Full-text search across all node names.
 
     Uses fuzzy matching to find nodes by name or qualified name.
+    Results are cached until the graph changes, and identical concurrent
+    searches share a single query.
     Target latency: <200ms
     """
-    logger.debug("search_requested", query=q, limit=limit, type_filter=type_filter)
+    if type_filter:
+        type_filter = type_filter.lower()
 
-    try:
-        results = await client.search_nodes(q, limit=limit * 2)  # Fetch extra for filtering
-
-        # Filter by type if specified
-        if type_filter:
-            type_filter = type_filter.lower()
-            results = [r for r in results if r.get("type") == type_filter]
-
-        # Limit results
-        results = results[:limit]
-
-        search_results = [
-            SearchResult(
-                id=r["id"],
-                name=r["name"],
-                type=r["type"],
-                qualified_name=r.get("qualified_name"),
-                line_number=r.get("line_number"),
-                docstring=r.get("docstring"),
-                score=r.get("score", 0.0),
-            )
-            for r in results
-        ]
+    async def build() -> bytes:
+        if _DEBUG:
+            logger.debug("search_requested", query=q, limit=limit, type_filter=type_filter)
+
+        results = await client.search_nodes(q, limit=limit, type_filter=type_filter)
+        search_results = _SEARCH_RESULT_LIST_ADAPTER.validate_python(results)
 
-        return SearchResponse(
+        return SearchResponse.model_construct(
             query=q,
             results=search_results,
             total=len(search_results),
-        )
+        ).model_dump_json().encode()
+
+    try:
+        body = await _coalesced(("search", q, limit, type_filter, get_graph_version()), build)
+        return Response(content=body, media_type="application/json")
 
     except Exception as e:
         logger.error("search_failed", query=q, error=str(e))
@@ -96,18 +140,21 @@ async def get_suggestions(
     q: str = Query(..., min_length=1, max_length=50, description="Partial query"),
     limit: int = Query(default=10, ge=1, le=50, description="Maximum suggestions"),
     client: Neo4jClient = Depends(require_neo4j_client),
-) -> dict[str, Any]:
+) -> Response:
     """
     Get autocomplete suggestions for a partial query.
 
     Returns quick suggestions for search-as-you-type.
+    Results are cached until the graph changes, and identical concurrent
+    requests share a single query.
     Target latency: <100ms
     """
-    logger.debug("suggestions_requested", query=q, limit=limit)
+    async def build() -> bytes:
+        if _DEBUG:
+            logger.debug("suggestions_requested", query=q, limit=limit)
 
-    try:
         # Use prefix search for suggestions
-        results = await client.search_nodes(f"{q}*", limit=limit)
+        results = await client.search_nodes(q, limit=limit, prefix=True)
 
         suggestions = [
             {
@@ -118,10 +165,14 @@ async def get_suggestions(
             for r in results
         ]
 
-        return {
+        return orjson.dumps({
             "query": q,
             "suggestions": suggestions,
-        }
+        })
+
+    try:
+        body = await _coalesced(("suggest", q, limit, get_graph_version()), build)
+        return Response(content=body, media_type="application/json")
 
     except Exception as e:
         logger.error("suggestions_failed", query=q, error=str(e))
@@ -145,7 +196,7 @@ async def get_node_types(
         RETURN label, count(*) as count
         ORDER BY count DESC
         """
-        results = await client.execute_query(query)
+        results = await client.execute_read(query)
 
         type_counts = {r["label"].lower(): r["count"] for r in results}
 
@@ -6,17 +6,78 @@ Requires Python 3.11+.
 """
 
 import asyncio
-import json
+import contextlib
+import time
+from collections.abc import Awaitable, Callable
 from typing import Any
 
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from pydantic import BaseModel
+from starlette.types import Message
 
 from utils.logger import get_logger
 
 router = APIRouter()
 logger = get_logger("api.websocket")
 
+# Seconds a single client may take to accept a broadcast frame
+SEND_TIMEOUT = 5.0
+
+# Clients sent to concurrently per event-loop tick before yielding to other
+# tasks; this also bounds the in-flight sends of a single broadcast
+BROADCAST_BATCH_SIZE = 50
+
+# Seconds file change events are collected before one batched broadcast
+FILE_CHANGE_WINDOW = 0.05
+
+# Seconds between heartbeat messages on each connection
+HEARTBEAT_INTERVAL = 30.0
+
+# Largest client message accepted before parsing (characters)
+MAX_MESSAGE_SIZE = 64 * 1024
+
+# Constant replies, encoded once at import
+_CONNECTED = orjson.dumps({
+    "type": "connected",
+    "message": "Connected to NeuroCode WebSocket",
+})
+_INVALID_JSON = orjson.dumps({"type": "error", "message": "Invalid JSON"})
+_MESSAGE_TOO_LARGE = orjson.dumps({"type": "error", "message": "Message too large"})
+_PONG = orjson.dumps({"type": "pong"})
+
+
+class FileChangeEvent(BaseModel):
+    """Event for file changes."""
+
+    type: str = "file_changed"
+    path: str
+    change_type: str  # created, modified, deleted
+
+
+class FileChangeBatchEvent(BaseModel):
+    """Event for file changes coalesced over a short window."""
+
+    type: str = "file_changed_batch"
+    changes: list[FileChangeEvent] = []
+
+
+class GraphUpdateEvent(BaseModel):
+    """Event for graph updates."""
+
+    type: str = "graph_updated"
+    added_count: int = 0
+    modified_count: int = 0
+    removed_count: int = 0
+    affected_modules: list[str] = []
+
+
+class HeartbeatEvent(BaseModel):
+    """Heartbeat event to keep connection alive."""
+
+    type: str = "heartbeat"
+    timestamp: float
+
 
 class WebSocketManager:
     """
@@ -27,8 +88,12 @@ class WebSocketManager:
 
     def __init__(self) -> None:
         """Initialize the WebSocket manager."""
-        self._connections: set[WebSocket] = set()
-        self._lock = asyncio.Lock()
+        # Keyed by id() so disconnects are a single pop, not a set rebuild.
+        # Every mutation and snapshot completes without awaiting, so on a
+        # single event loop no lock is needed around them.
+        self._connections: dict[int, WebSocket] = {}
+        self._pending_changes: list[FileChangeEvent] = []
+        self._flush_task: asyncio.Task[None] | None = None
 
     async def connect(self, websocket: WebSocket) -> None:
         """
@@ -38,8 +103,7 @@ class WebSocketManager:
             websocket: The WebSocket connection to register
         """
         await websocket.accept()
-        async with self._lock:
-            self._connections.add(websocket)
+        self._connections[id(websocket)] = websocket
         logger.info("websocket_connected", total_connections=len(self._connections))
 
     async def disconnect(self, websocket: WebSocket) -> None:
@@ -49,8 +113,7 @@ class WebSocketManager:
         Args:
             websocket: The WebSocket connection to unregister
         """
-        async with self._lock:
-            self._connections.discard(websocket)
+        self._connections.pop(id(websocket), None)
         logger.info("websocket_disconnected", total_connections=len(self._connections))
 
     async def broadcast(self, message: dict[str, Any]) -> None:
@@ -63,19 +126,100 @@ class WebSocketManager:
         if not self._connections:
             return
 
-        message_json = json.dumps(message)
-        disconnected: set[WebSocket] = set()
+        # Serialized once; every client gets the same UTF-8 JSON bytes
+        await self.broadcast_raw(orjson.dumps(message))
+
+    async def broadcast_raw(self, payload: bytes) -> None:
+        """
+        Broadcast an already-encoded message to all connected clients.
+
+        Args:
+            payload: JSON-encoded message bytes
+        """
+        if not self._connections:
+            return
+
+        # Snapshot so connects/disconnects during the sends are not blocked
+        connections = list(self._connections.values())
+
+        # One ASGI send message shared by every client; send_bytes would
+        # build an identical dict per connection
+        message: Message = {"type": "websocket.send", "bytes": payload}
+
+        failures: list[Exception] = []
+        for start in range(0, len(connections), BROADCAST_BATCH_SIZE):
+            batch = connections[start:start + BROADCAST_BATCH_SIZE]
+            results = await asyncio.gather(
+                *(self._safe_send(connection, message) for connection in batch)
+            )
+            failures.extend(error for error in results if error is not None)
+            # Let heartbeats and HTTP handlers run between batches
+            await asyncio.sleep(0)
+
+        # One log entry per broadcast, even when a network blip drops everyone
+        if failures:
+            logger.warning(
+                "broadcast_failed",
+                failed_count=len(failures),
+                sample_error=str(failures[0]) or type(failures[0]).__name__,
+            )
+
+    async def _safe_send(self, websocket: WebSocket, message: Message) -> Exception | None:
+        """
+        Send a prepared ASGI message to one client, bounded by the send timeout.
 
-        async with self._lock:
-            for connection in self._connections:
-                try:
-                    await connection.send_text(message_json)
-                except Exception as e:
-                    logger.warning("broadcast_failed", error=str(e))
-                    disconnected.add(connection)
+        A client whose send fails is dropped on the spot, so broadcasts
+        need no separate cleanup pass. A client that times out is also
+        closed, so it reconnects instead of silently missing broadcasts.
 
-            # Clean up disconnected clients
-            self._connections -= disconnected
+        Args:
+            websocket: Target WebSocket connection
+            message: ASGI websocket.send message
+
+        Returns:
+            The send error, or None if the send succeeded
+        """
+        try:
+            await asyncio.wait_for(websocket.send(message), timeout=SEND_TIMEOUT)
+        except TimeoutError as e:
+            self._connections.pop(id(websocket), None)
+            # 1011: the server cannot keep serving this client
+            with contextlib.suppress(Exception):
+                await websocket.close(code=1011)
+            return e
+        except Exception as e:
+            self._connections.pop(id(websocket), None)
+            return e
+        return None
+
+    def queue_file_change(self, change: FileChangeEvent) -> None:
+        """
+        Queue a file change for the next batched broadcast.
+
+        Changes arriving within FILE_CHANGE_WINDOW of each other are sent
+        as a single file_changed_batch message.
+
+        Args:
+            change: The file change event
+        """
+        self._pending_changes.append(change)
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_after(FILE_CHANGE_WINDOW))
+
+    async def _flush_after(self, delay: float) -> None:
+        """
+        Broadcast all queued file changes after a delay.
+
+        Args:
+            delay: Seconds to wait for further changes
+        """
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            changes, self._pending_changes = self._pending_changes, []
+            self._flush_task = None
+        event = FileChangeBatchEvent(changes=changes)
+        await self.broadcast_raw(event.model_dump_json().encode())
 
     async def send_to(self, websocket: WebSocket, message: dict[str, Any]) -> None:
         """
@@ -85,11 +229,26 @@ class WebSocketManager:
             websocket: Target WebSocket connection
             message: The message to send
         """
+        await self.send_raw(websocket, orjson.dumps(message))
+
+    async def send_raw(self, websocket: WebSocket, payload: bytes) -> None:
+        """
+        Send an already-encoded message to a specific client.
+
+        Args:
+            websocket: Target WebSocket connection
+            payload: JSON-encoded message bytes
+        """
         try:
-            await websocket.send_text(json.dumps(message))
+            await websocket.send_bytes(payload)
         except Exception as e:
             logger.warning("send_failed", error=str(e))
 
+    @property
+    def has_connections(self) -> bool:
+        """Check whether any client is connected."""
+        return bool(self._connections)
+
     @property
     def connection_count(self) -> int:
         """Get the number of active connections."""
@@ -105,31 +264,6 @@ def get_manager() -> WebSocketManager:
     return manager
 
 
-class FileChangeEvent(BaseModel):
-    """Event for file changes."""
-
-    type: str = "file_changed"
-    path: str
-    change_type: str  # created, modified, deleted
-
-
-class GraphUpdateEvent(BaseModel):
-    """Event for graph updates."""
-
-    type: str = "graph_updated"
-    added_count: int = 0
-    modified_count: int = 0
-    removed_count: int = 0
-    affected_modules: list[str] = []
-
-
-class HeartbeatEvent(BaseModel):
-    """Heartbeat event to keep connection alive."""
-
-    type: str = "heartbeat"
-    timestamp: float
-
-
 @router.websocket("")
 async def websocket_endpoint(websocket: WebSocket) -> None:
     """
@@ -143,43 +277,77 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
     await manager.connect(websocket)
 
     # Send initial connection confirmation
-    await manager.send_to(websocket, {
-        "type": "connected",
-        "message": "Connected to NeuroCode WebSocket",
-    })
+    await manager.send_raw(websocket, _CONNECTED)
+
+    # One long-lived timer per connection instead of a wait_for per message
+    heartbeat_task = asyncio.create_task(_heartbeat_loop(websocket))
 
     try:
         while True:
             # Wait for client messages (ping/pong, or custom commands)
+            data = await websocket.receive_text()
+            if len(data) > MAX_MESSAGE_SIZE:
+                await manager.send_raw(websocket, _MESSAGE_TOO_LARGE)
+                continue
+
+            # Handle client messages
             try:
-                data = await asyncio.wait_for(
-                    websocket.receive_text(),
-                    timeout=30.0,  # 30 second timeout
-                )
-
-                # Handle client messages
-                try:
-                    message = json.loads(data)
-                    await handle_client_message(websocket, message)
-                except json.JSONDecodeError:
-                    await manager.send_to(websocket, {
-                        "type": "error",
-                        "message": "Invalid JSON",
-                    })
-
-            except asyncio.TimeoutError:
-                # Send heartbeat on timeout
-                import time
-                await manager.send_to(websocket, {
-                    "type": "heartbeat",
-                    "timestamp": time.time(),
-                })
+                message = orjson.loads(data)
+                await handle_client_message(websocket, message)
+            except orjson.JSONDecodeError:
+                await manager.send_raw(websocket, _INVALID_JSON)
 
     except WebSocketDisconnect:
         await manager.disconnect(websocket)
     except Exception as e:
         logger.error("websocket_error", error=str(e))
         await manager.disconnect(websocket)
+    finally:
+        heartbeat_task.cancel()
+
+
+async def _heartbeat_loop(websocket: WebSocket) -> None:
+    """
+    Send heartbeat messages to a client until cancelled.
+
+    Args:
+        websocket: The WebSocket connection to keep alive
+    """
+    while True:
+        await asyncio.sleep(HEARTBEAT_INTERVAL)
+        event = HeartbeatEvent(timestamp=time.time())
+        await manager.send_raw(websocket, event.model_dump_json().encode())
+
+
+async def _handle_ping(websocket: WebSocket, _message: dict[str, Any]) -> None:
+    """Respond to a ping with pong."""
+    await manager.send_raw(websocket, _PONG)
+
+
+async def _handle_subscribe(websocket: WebSocket, message: dict[str, Any]) -> None:
+    """Acknowledge a subscription request (future enhancement)."""
+    await manager.send_to(websocket, {
+        "type": "subscribed",
+        "topics": message.get("topics", []),
+    })
+
+
+async def _handle_unsubscribe(websocket: WebSocket, message: dict[str, Any]) -> None:
+    """Acknowledge an unsubscribe request."""
+    await manager.send_to(websocket, {
+        "type": "unsubscribed",
+        "topics": message.get("topics", []),
+    })
+
+
+# Client message type -> handler
+_MESSAGE_HANDLERS: dict[
+    str, Callable[[WebSocket, dict[str, Any]], Awaitable[None]]
+] = {
+    "ping": _handle_ping,
+    "subscribe": _handle_subscribe,
+    "unsubscribe": _handle_unsubscribe,
+}
 
 
 async def handle_client_message(websocket: WebSocket, message: dict[str, Any]) -> None:
@@ -192,25 +360,10 @@ async def handle_client_message(websocket: WebSocket, message: dict[str, Any]) -
     - unsubscribe: Unsubscribe from events
     """
     msg_type = message.get("type", "")
+    handler = _MESSAGE_HANDLERS.get(msg_type) if isinstance(msg_type, str) else None
 
-    if msg_type == "ping":
-        await manager.send_to(websocket, {"type": "pong"})
-
-    elif msg_type == "subscribe":
-        # Handle subscription requests (future enhancement)
-        topics = message.get("topics", [])
-        await manager.send_to(websocket, {
-            "type": "subscribed",
-            "topics": topics,
-        })
-
-    elif msg_type == "unsubscribe":
-        topics = message.get("topics", [])
-        await manager.send_to(websocket, {
-            "type": "unsubscribed",
-            "topics": topics,
-        })
-
+    if handler is not None:
+        await handler(websocket, message)
     else:
         await manager.send_to(websocket, {
             "type": "error",
@@ -222,17 +375,18 @@ async def broadcast_file_change(path: str, change_type: str) -> None:
     """
     Broadcast a file change event to all clients.
 
-    Called by the file watcher when files change.
+    Called by the file watcher when files change. Events are coalesced
+    into a file_changed_batch message so bursts (e.g. branch switches)
+    cost one serialization and fan-out.
 
     Args:
         path: Path to the changed file
         change_type: Type of change (created, modified, deleted)
     """
-    await manager.broadcast({
-        "type": "file_changed",
-        "path": path,
-        "change_type": change_type,
-    })
+    if not manager.has_connections:
+        return
+
+    manager.queue_file_change(FileChangeEvent(path=path, change_type=change_type))
 
 
 async def broadcast_graph_update(
@@ -252,10 +406,13 @@ async def broadcast_graph_update(
         removed: Number of nodes removed
         affected_modules: List of affected module paths
     """
-    await manager.broadcast({
-        "type": "graph_updated",
-        "added_count": added,
-        "modified_count": modified,
-        "removed_count": removed,
-        "affected_modules": affected_modules or [],
-    })
+    if not manager.has_connections:
+        return
+
+    event = GraphUpdateEvent(
+        added_count=added,
+        modified_count=modified,
+        removed_count=removed,
+        affected_modules=affected_modules or [],
+    )
+    await manager.broadcast_raw(event.model_dump_json().encode())
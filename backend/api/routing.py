@@ -0,0 +1,63 @@
+"""
+NeuroCode API Routing.
+
+Custom route classes shared by the API routers.
+Requires Python 3.11+.
+"""
+
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+from fastapi import Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, ValidationError
+
+
+class ValidateJsonRoute(APIRoute):
+    """
+    Route that validates a JSON request body directly from bytes.
+
+    For endpoints taking a single Pydantic model as their body, the raw
+    bytes are handed to pydantic-core via model_validate_json instead of
+    json.loads followed by model validation. The resulting model is stored
+    as the request's parsed JSON, so FastAPI's own body handling receives
+    an existing instance and does not parse or validate it again.
+    """
+
+    def _json_body_model(self) -> type[BaseModel] | None:
+        """Get the body model if this route has a single, non-embedded one."""
+        if self.body_field is None or len(self.dependant.body_params) != 1:
+            return None
+        if getattr(self.body_field.field_info, "embed", False):
+            return None
+        annotation = self.body_field.field_info.annotation
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            return annotation
+        return None
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+        body_model = self._json_body_model()
+        if body_model is None:
+            return handler
+
+        async def route_handler(request: Request) -> Response:
+            content_type = request.headers.get("content-type", "application/json")
+            body = await request.body()
+            if body and "json" in content_type:
+                try:
+                    parsed = body_model.model_validate_json(body)
+                except ValidationError as e:
+                    raise RequestValidationError(
+                        [
+                            {**error, "loc": ("body", *error["loc"])}
+                            for error in e.errors(include_url=False)
+                        ],
+                        body=body,
+                    )
+                # Starlette caches parsed JSON on the request; FastAPI reads it back
+                request._json = parsed
+            return await handler(request)
+
+        return route_handler
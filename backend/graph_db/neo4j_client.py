@@ -6,21 +6,443 @@ Requires Python 3.11+.
 """
 
 import asyncio
-import json
+from collections import defaultdict
+from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Any, AsyncIterator
-from uuid import UUID
-
-from neo4j import AsyncGraphDatabase, AsyncDriver, AsyncSession, AsyncTransaction
-from neo4j.exceptions import ServiceUnavailable, SessionExpired, TransientError
-
+from typing import Any
+
+import orjson
+from neo4j import (
+    READ_ACCESS,
+    WRITE_ACCESS,
+    AsyncDriver,
+    AsyncGraphDatabase,
+    AsyncManagedTransaction,
+    AsyncSession,
+)
+
+from graph_db.queries import CypherQuery, QueryLibrary
 from graph_db.schema import GraphSchema, NodeLabel, RelationshipLabel
-from parser.models import ModuleInfo, ClassInfo, FunctionInfo, VariableInfo, PackageInfo, Relationship
+from parser.models import (
+    ClassInfo,
+    FunctionInfo,
+    ModuleInfo,
+    PackageInfo,
+    Relationship,
+    RelationshipType,
+    VariableInfo,
+)
+from utils.cache import TTLCache
 from utils.config import get_settings
 from utils.logger import LoggerMixin
 
 
+# API node type -> Neo4j label, for pushing type filters into Cypher
+_TYPE_TO_LABEL = {
+    "package": "Package",
+    "module": "Module",
+    "class": "Class",
+    "function": "Function",
+    "variable": "Variable",
+}
+
+_NODE_CHILDREN_QUERY = """
+        MATCH (parent {id: $node_id})-[:CONTAINS]->(child)
+        WITH child, labels(child) as labels
+        WITH child, labels,
+             CASE
+                 WHEN 'Package' IN labels THEN 0
+                 WHEN 'Module' IN labels THEN 1
+                 WHEN 'Class' IN labels THEN 2
+                 WHEN 'Function' IN labels THEN 3
+                 WHEN 'Variable' IN labels THEN 4
+                 ELSE 5
+             END as sort_order
+        ORDER BY sort_order, child.name, child.line_number
+        LIMIT $limit
+        // Grandchildren are counted only for the children returned
+        RETURN child.id as id,
+               child.name as name,
+               child.qualified_name as qualified_name,
+               child.line_number as line_number,
+               child.docstring as docstring,
+               COUNT { (child)-[:CONTAINS]->() } as child_count,
+               coalesce(toLower(head(labels)), 'unknown') as type,
+               child.is_async as is_async,
+               child.is_method as is_method,
+               child.is_abstract as is_abstract,
+               child.complexity as complexity
+        ORDER BY sort_order, name, line_number
+        """
+
+# Reference edges are every written relationship type except CONTAINS
+_REFERENCE_TYPES = "|".join(
+    rel_type.value.upper()
+    for rel_type in RelationshipType
+    if rel_type is not RelationshipType.CONTAINS
+)
+
+_NODE_REFERENCES_QUERY = """
+        MATCH (node {id: $node_id})
+        CALL {
+            WITH node
+            MATCH (node)-[r:""" + _REFERENCE_TYPES + """]->(related)
+            RETURN related, type(r) as rel_type, 'outgoing' as direction
+            UNION ALL
+            WITH node
+            MATCH (node)<-[r:""" + _REFERENCE_TYPES + """]-(related)
+            RETURN related, type(r) as rel_type, 'incoming' as direction
+        }
+        RETURN related.id as id,
+               related.name as name,
+               related.qualified_name as qualified_name,
+               rel_type,
+               direction,
+               coalesce(toLower(head(labels(related))), 'unknown') as type
+        """
+
+# Backslash-escapes every Lucene query syntax character in one pass
+_LUCENE_ESCAPE = str.maketrans({c: "\\" + c for c in '+-&|!(){}[]^"~*?:\\/'})
+
+# Rows per UNWIND statement in bulk writes
+_WRITE_BATCH_SIZE = 1000
+
+# Modules per transaction in bulk node writes; larger inputs are split and
+# the transactions run concurrently
+_MODULES_PER_TRANSACTION = 100
+
+_PACKAGE_ROWS_QUERY = """
+        UNWIND $rows AS r
+        MERGE (p:Package {id: r.id})
+        SET p.path = r.path,
+            p.name = r.name,
+            p.qualified_name = r.qualified_name,
+            p.parent_id = r.parent_id,
+            p.docstring = r.docstring
+        """
+
+# Node writes take their verb as a placeholder: MERGE upserts, CREATE
+# skips the existence lookup when loading into an empty graph
+_MODULE_ROWS_TEMPLATE = """
+        UNWIND $rows AS r
+        {verb} (m:Module {{id: r.id}})
+        SET m.path = r.path,
+            m.name = r.name,
+            m.package = r.package,
+            m.qualified_name = r.qualified_name,
+            m.hash = r.hash,
+            m.lines_of_code = r.lines_of_code,
+            m.docstring = r.docstring,
+            m.last_modified = datetime()
+        """
+
+# Member queries are specialised per parent label so the parent lookup
+# uses that label's id constraint instead of scanning every node
+_CLASS_ROWS_TEMPLATE = """
+        UNWIND $rows AS r
+        MATCH (parent:{parent_label} {{id: r.parent_id}})
+        {verb} (c:Class {{id: r.id}})
+        SET c.name = r.name,
+            c.qualified_name = r.qualified_name,
+            c.hash = r.hash,
+            c.is_abstract = r.is_abstract,
+            c.bases = r.bases,
+            c.line_number = r.line_number,
+            c.docstring = r.docstring
+        {verb} (parent)-[:CONTAINS]->(c)
+        """
+
+_FUNCTION_ROWS_TEMPLATE = """
+        UNWIND $rows AS r
+        MATCH (parent:{parent_label} {{id: r.parent_id}})
+        {verb} (f:Function {{id: r.id}})
+        SET f.name = r.name,
+            f.qualified_name = r.qualified_name,
+            f.hash = r.hash,
+            f.is_async = r.is_async,
+            f.is_generator = r.is_generator,
+            f.is_method = r.is_method,
+            f.is_classmethod = r.is_classmethod,
+            f.is_staticmethod = r.is_staticmethod,
+            f.is_property = r.is_property,
+            f.parameters = r.parameters,
+            f.return_type = r.return_type,
+            f.complexity = r.complexity,
+            f.line_number = r.line_number,
+            f.docstring = r.docstring
+        {verb} (parent)-[:CONTAINS]->(f)
+        """
+
+_VARIABLE_ROWS_TEMPLATE = """
+        UNWIND $rows AS r
+        MATCH (parent:{parent_label} {{id: r.parent_id}})
+        {verb} (v:Variable {{id: r.id}})
+        SET v.name = r.name,
+            v.scope = r.scope,
+            v.type_hint = r.type_hint,
+            v.initial_value = r.initial_value,
+            v.is_constant = r.is_constant,
+            v.line_number = r.line_number
+        {verb} (parent)-[:CONTAINS]->(v)
+        """
+
+# Deletes in committed batches so transaction state stays bounded; needs an
+# auto-commit transaction. Descendants go first, then the modules themselves.
+# The aggregation collects every descendant before the first batch commits,
+# and deepest-first order keeps a detached class from hiding its methods.
+_DELETE_DESCENDANTS_QUERY = f"""
+        UNWIND $paths AS path
+        MATCH p = (:Module {{path: path}})-[:CONTAINS*]->(node)
+        WITH node, max(length(p)) AS depth
+        ORDER BY depth DESC
+        CALL {{ WITH node DETACH DELETE node }} IN TRANSACTIONS OF {_WRITE_BATCH_SIZE} ROWS
+        RETURN count(*) AS deleted_count
+        """
+
+_DELETE_MODULES_QUERY = """
+        UNWIND $paths AS path
+        MATCH (m:Module {path: path})
+        DETACH DELETE m
+        RETURN count(*) AS deleted_count
+        """
+
+# Endpoints may carry any node label; naming them all lets the planner seek
+# each label's id constraint index instead of scanning every node per row
+_ENDPOINT_LABELS = "|".join(_TYPE_TO_LABEL.values())
+
+# Relationship types come from the RelationshipType enum, never user input
+_RELATIONSHIP_TEMPLATE = """
+        MATCH (source:{labels} {{id: $source_id}})
+        MATCH (target:{labels} {{id: $target_id}})
+        MERGE (source)-[r:{rel_type}]->(target)
+        SET r += $properties
+        """
+
+_RELATIONSHIP_ROWS_TEMPLATE = """
+        UNWIND $rows AS r
+        MATCH (source:{labels} {{id: r.source_id}})
+        MATCH (target:{labels} {{id: r.target_id}})
+        MERGE (source)-[rel:{rel_type}]->(target)
+        SET rel += r.properties
+        """
+
+# Templated queries expanded once at import, so every call sends the same
+# query text and hits the server's plan cache
+_PARENT_LABELS = ("Module", "Class")
+_MODULE_ROWS_QUERY = _MODULE_ROWS_TEMPLATE.format(verb="MERGE")
+_CLASS_ROWS_QUERIES = {
+    label: _CLASS_ROWS_TEMPLATE.format(parent_label=label, verb="MERGE")
+    for label in _PARENT_LABELS
+}
+_FUNCTION_ROWS_QUERIES = {
+    label: _FUNCTION_ROWS_TEMPLATE.format(parent_label=label, verb="MERGE")
+    for label in _PARENT_LABELS
+}
+_VARIABLE_ROWS_QUERIES = {
+    label: _VARIABLE_ROWS_TEMPLATE.format(parent_label=label, verb="MERGE")
+    for label in _PARENT_LABELS
+}
+_RELATIONSHIP_QUERIES = {
+    rel_type: _RELATIONSHIP_TEMPLATE.format(
+        labels=_ENDPOINT_LABELS, rel_type=rel_type.value.upper()
+    )
+    for rel_type in RelationshipType
+}
+_RELATIONSHIP_ROWS_QUERIES = {
+    rel_type: _RELATIONSHIP_ROWS_TEMPLATE.format(
+        labels=_ENDPOINT_LABELS, rel_type=rel_type.value.upper()
+    )
+    for rel_type in RelationshipType
+}
+
+# CREATE-only variants of the node writes, keyed by their MERGE query, for
+# loading into an empty graph; they skip the existence lookup MERGE does for
+# every node and CONTAINS edge
+_CREATE_ONLY_QUERIES = {
+    _MODULE_ROWS_QUERY: _MODULE_ROWS_TEMPLATE.format(verb="CREATE"),
+    **{
+        queries[label]: template.format(parent_label=label, verb="CREATE")
+        for template, queries in (
+            (_CLASS_ROWS_TEMPLATE, _CLASS_ROWS_QUERIES),
+            (_FUNCTION_ROWS_TEMPLATE, _FUNCTION_ROWS_QUERIES),
+            (_VARIABLE_ROWS_TEMPLATE, _VARIABLE_ROWS_QUERIES),
+        )
+        for label in _PARENT_LABELS
+    },
+}
+
+
+def _package_row(package: PackageInfo) -> dict[str, Any]:
+    """Build the write parameters for a package node."""
+    return {
+        "id": package.id,
+        "path": str(package.path),
+        "name": package.name,
+        "qualified_name": package.qualified_name,
+        "parent_id": package.parent_id,
+        "docstring": package.docstring,
+    }
+
+
+def _module_row(module: ModuleInfo) -> dict[str, Any]:
+    """Build the write parameters for a module node."""
+    return {
+        "id": module.id,
+        "path": str(module.path),
+        "name": module.name,
+        "package": module.package,
+        "qualified_name": module.qualified_name,
+        "hash": module.hash,
+        "lines_of_code": module.lines_of_code,
+        "docstring": module.docstring,
+    }
+
+
+def _class_row(cls: ClassInfo, parent_id: str) -> dict[str, Any]:
+    """Build the write parameters for a class node."""
+    return {
+        "parent_id": parent_id,
+        "id": cls.id,
+        "name": cls.name,
+        "qualified_name": cls.qualified_name,
+        "hash": "",  # Will be set by Merkle tree
+        "is_abstract": cls.is_abstract,
+        "bases": orjson.dumps(cls.bases).decode(),
+        "line_number": cls.location.line if cls.location else None,
+        "docstring": cls.docstring,
+    }
+
+
+def _function_row(func: FunctionInfo, parent_id: str) -> dict[str, Any]:
+    """Build the write parameters for a function node."""
+    return {
+        "parent_id": parent_id,
+        "id": func.id,
+        "name": func.name,
+        "qualified_name": func.qualified_name,
+        "hash": func.body_hash,
+        "is_async": func.is_async,
+        "is_generator": func.is_generator,
+        "is_method": func.is_method,
+        "is_classmethod": func.is_classmethod,
+        "is_staticmethod": func.is_staticmethod,
+        "is_property": func.is_property,
+        "parameters": orjson.dumps([p.as_dict for p in func.parameters]).decode(),
+        "return_type": func.return_type,
+        "complexity": func.complexity,
+        "line_number": func.location.line if func.location else None,
+        "docstring": func.docstring,
+    }
+
+
+def _variable_row(var: VariableInfo, parent_id: str) -> dict[str, Any]:
+    """Build the write parameters for a variable node."""
+    return {
+        "parent_id": parent_id,
+        "id": var.id,
+        "name": var.name,
+        "scope": var.scope,
+        "type_hint": var.type_hint,
+        "initial_value": var.initial_value,
+        "is_constant": var.is_constant,
+        "line_number": var.location.line if var.location else None,
+    }
+
+
+def _node_write_statements(modules: list[ModuleInfo]) -> list[tuple[str, list[dict[str, Any]]]]:
+    """
+    Flatten parsed modules into ordered UNWIND statements.
+
+    Parents are always written before their members: modules, then classes
+    one nesting level at a time, then functions and variables.
+
+    Args:
+        modules: Parsed modules to write
+
+    Returns:
+        (query, rows) pairs in execution order
+    """
+    module_rows = [_module_row(module) for module in modules]
+    class_levels: list[list[dict[str, Any]]] = []
+    members: dict[str, list[dict[str, Any]]] = {
+        "module_functions": [],
+        "module_variables": [],
+        "class_functions": [],
+        "class_variables": [],
+    }
+
+    level: list[tuple[ClassInfo, str]] = []
+    for module in modules:
+        module_id = module.id
+        level.extend((cls, module_id) for cls in module.classes)
+        members["module_functions"].extend(_function_row(f, module_id) for f in module.functions)
+        members["module_variables"].extend(_variable_row(v, module_id) for v in module.variables)
+
+    # Walk nested classes breadth-first, one nesting level per statement
+    while level:
+        class_levels.append([_class_row(cls, parent_id) for cls, parent_id in level])
+        next_level: list[tuple[ClassInfo, str]] = []
+        for cls, _ in level:
+            class_id = cls.id
+            members["class_functions"].extend(_function_row(m, class_id) for m in cls.methods)
+            members["class_variables"].extend(_variable_row(v, class_id) for v in cls.all_variables)
+            next_level.extend((nested, class_id) for nested in cls.nested_classes)
+        level = next_level
+
+    statements: list[tuple[str, list[dict[str, Any]]]] = [(_MODULE_ROWS_QUERY, module_rows)]
+    for depth, rows in enumerate(class_levels):
+        parent_label = "Module" if depth == 0 else "Class"
+        statements.append((_CLASS_ROWS_QUERIES[parent_label], rows))
+    statements += [
+        (_FUNCTION_ROWS_QUERIES["Module"], members["module_functions"]),
+        (_FUNCTION_ROWS_QUERIES["Class"], members["class_functions"]),
+        (_VARIABLE_ROWS_QUERIES["Module"], members["module_variables"]),
+        (_VARIABLE_ROWS_QUERIES["Class"], members["class_variables"]),
+    ]
+    return [(query, rows) for query, rows in statements if rows]
+
+
+async def _fetch_all(
+    tx: AsyncManagedTransaction, query: str, parameters: dict[str, Any]
+) -> list[dict[str, Any]]:
+    """Run a query and collect every record as a dictionary."""
+    result = await tx.run(query, parameters)
+    return await result.data()
+
+
+async def _write_counters(
+    tx: AsyncManagedTransaction, query: str, parameters: dict[str, Any]
+) -> dict[str, Any]:
+    """Run a write query and summarise what it changed."""
+    result = await tx.run(query, parameters)
+    summary = await result.consume()
+    return {
+        "nodes_created": summary.counters.nodes_created,
+        "nodes_deleted": summary.counters.nodes_deleted,
+        "relationships_created": summary.counters.relationships_created,
+        "relationships_deleted": summary.counters.relationships_deleted,
+        "properties_set": summary.counters.properties_set,
+    }
+
+
+async def _run_batched(
+    tx: AsyncManagedTransaction, statements: list[tuple[str, list[dict[str, Any]]]]
+) -> None:
+    """Run UNWIND statements in order, in chunks of _WRITE_BATCH_SIZE rows."""
+    for query, rows in statements:
+        for start in range(0, len(rows), _WRITE_BATCH_SIZE):
+            result = await tx.run(query, rows=rows[start:start + _WRITE_BATCH_SIZE])
+            await result.consume()
+
+
+async def _run_statements(tx: AsyncManagedTransaction, statements: list[str]) -> None:
+    """Run parameterless statements in order within one transaction."""
+    for statement in statements:
+        result = await tx.run(statement)
+        await result.consume()
+
+
 class Neo4jClient(LoggerMixin):
     """
     Async Neo4j client with connection pooling and retry logic.
@@ -33,6 +455,25 @@ class Neo4jClient(LoggerMixin):
         """Initialize the Neo4j client."""
         self._driver: AsyncDriver | None = None
         self._settings = get_settings().neo4j
+        # Session config built once per access mode; reads may be routed to
+        # followers on a cluster, writes always go to the leader
+        self._session_configs: dict[str, dict[str, Any]] = {
+            mode: {"database": self._settings.database, "default_access_mode": mode}
+            for mode in (READ_ACCESS, WRITE_ACCESS)
+        }
+        # Idle sessions per access mode, kept open for reuse
+        self._idle_sessions: dict[str, list[AsyncSession]] = {
+            READ_ACCESS: [],
+            WRITE_ACCESS: [],
+        }
+        # Read-aside cache for navigation queries, invalidated before and
+        # after every write made through this client; the TTL bounds
+        # staleness for writes made elsewhere (e.g. the CLI scripts)
+        self._read_cache: TTLCache[list[dict[str, Any]]] = TTLCache(maxsize=10_000, ttl=30.0)
+        # Bumped on every invalidation; a read only fills the cache if no
+        # write started or finished while it ran
+        self._cache_generation = 0
+        self._writes_in_flight = 0
 
     async def connect(self) -> None:
         """
@@ -48,6 +489,11 @@ class Neo4jClient(LoggerMixin):
             auth=(self._settings.user, self._settings.password),
             max_connection_pool_size=self._settings.max_connection_pool_size,
             connection_timeout=self._settings.connection_timeout,
+            connection_acquisition_timeout=self._settings.connection_acquisition_timeout,
+            max_connection_lifetime=self._settings.max_connection_lifetime,
+            keep_alive=self._settings.keep_alive,
+            fetch_size=self._settings.fetch_size,
+            max_transaction_retry_time=self._settings.max_transaction_retry_time,
         )
 
         # Verify connectivity
@@ -64,16 +510,28 @@ class Neo4jClient(LoggerMixin):
 
     async def close(self) -> None:
         """Close the Neo4j connection."""
+        for idle in self._idle_sessions.values():
+            while idle:
+                await idle.pop().close()
+
         if self._driver is not None:
             await self._driver.close()
             self._driver = None
             self.log.info("neo4j_disconnected")
 
     @asynccontextmanager
-    async def session(self) -> AsyncIterator[AsyncSession]:
+    async def session(self, access_mode: str = WRITE_ACCESS) -> AsyncIterator[AsyncSession]:
         """
         Get a Neo4j session with automatic cleanup.
 
+        Sessions are reused across calls instead of being opened and closed
+        per query. Each session serves one caller at a time; a session whose
+        caller raised is closed rather than returned, since it may hold an
+        unconsumed result or a broken connection.
+
+        Args:
+            access_mode: READ_ACCESS or WRITE_ACCESS
+
         Yields:
             AsyncSession for executing queries
         """
@@ -81,54 +539,181 @@ class Neo4jClient(LoggerMixin):
             await self.connect()
 
         assert self._driver is not None
-        session = self._driver.session(database=self._settings.database)
+        idle = self._idle_sessions[access_mode]
+        session = (
+            idle.pop() if idle else self._driver.session(**self._session_configs[access_mode])
+        )
+
         try:
             yield session
-        finally:
+        except BaseException:
+            await session.close()
+            raise
+
+        if len(idle) < self._settings.max_connection_pool_size:
+            idle.append(session)
+        else:
             await session.close()
 
     async def execute_query(
         self,
         query: str,
         parameters: dict[str, Any] | None = None,
-        retries: int = 3,
+        access_mode: str = WRITE_ACCESS,
     ) -> list[dict[str, Any]]:
         """
-        Execute a Cypher query with retry logic.
+        Execute a Cypher query in a managed transaction.
+
+        The driver retries transient failures (leader switches, deadlocks,
+        lost connections) with backoff, up to max_transaction_retry_time.
 
         Args:
             query: Cypher query string
             parameters: Query parameters
-            retries: Number of retries on transient errors
+            access_mode: READ_ACCESS for queries that never write
 
         Returns:
             List of result records as dictionaries
         """
-        last_error: Exception | None = None
+        try:
+            async with self.session(access_mode) as session:
+                if access_mode == READ_ACCESS:
+                    return await session.execute_read(_fetch_all, query, parameters or {})
+                async with self._invalidating_reads():
+                    return await session.execute_write(_fetch_all, query, parameters or {})
 
-        for attempt in range(retries):
-            try:
-                async with self.session() as session:
-                    result = await session.run(query, parameters or {})
-                    records = await result.data()
-                    return records
+        except Exception as e:
+            self.log.error("query_failed", query=query[:100], error=str(e))
+            raise
 
-            except (ServiceUnavailable, SessionExpired, TransientError) as e:
-                last_error = e
-                self.log.warning(
-                    "query_retry",
-                    attempt=attempt + 1,
-                    error=str(e),
-                )
-                await asyncio.sleep(0.1 * (2**attempt))  # Exponential backoff
+    async def execute_read(
+        self,
+        query: str,
+        parameters: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Execute a read-only Cypher query in a managed transaction.
 
-            except Exception as e:
-                self.log.error("query_failed", query=query[:100], error=str(e))
-                raise
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
 
-        if last_error:
-            raise last_error
-        return []
+        Returns:
+            List of result records as dictionaries
+        """
+        return await self.execute_query(query, parameters, access_mode=READ_ACCESS)
+
+    async def _cached_read(
+        self,
+        query: str,
+        parameters: dict[str, Any],
+    ) -> list[dict[str, Any]]:
+        """
+        Execute a read-only query through the read-aside cache.
+
+        Callers must treat the returned records as read-only, since they
+        are shared with later cache hits.
+
+        Args:
+            query: Cypher query string
+            parameters: Query parameters (hashable values only)
+
+        Returns:
+            List of result records as dictionaries
+        """
+        key = (query, tuple(sorted(parameters.items())))
+        records = self._read_cache.get(key)
+        if records is None:
+            generation = self._cache_generation
+            records = await self.execute_read(query, parameters)
+            # A write that overlapped this read may have been half applied
+            if generation == self._cache_generation and not self._writes_in_flight:
+                self._read_cache.set(key, records)
+        return records
+
+    @asynccontextmanager
+    async def _invalidating_reads(self) -> AsyncIterator[None]:
+        """
+        Invalidate the read cache around a write.
+
+        The cache is cleared when the write starts and again once it has
+        committed or failed, and reads that overlap the write never store
+        their results.
+        """
+        self._writes_in_flight += 1
+        self._invalidate_reads()
+        try:
+            yield
+        finally:
+            self._writes_in_flight -= 1
+            self._invalidate_reads()
+
+    def _invalidate_reads(self) -> None:
+        """Drop cached reads and fence off reads already in flight."""
+        self._cache_generation += 1
+        self._read_cache.clear()
+
+    async def run_query(
+        self,
+        query: CypherQuery,
+        parameters: dict[str, Any] | None = None,
+        label: NodeLabel | str | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Execute a QueryLibrary query.
+
+        The normalized query text is sent and used as the cache key, so
+        results are shared however the query text was laid out. Read-only
+        queries go through the read-aside cache; any other query runs as a
+        write and invalidates it.
+
+        Args:
+            query: Query from QueryLibrary
+            parameters: Query parameters
+            label: Label of the node with id $node_id, if known
+
+        Returns:
+            List of result records as dictionaries
+
+        Raises:
+            ValueError: If a required parameter is missing or the label is unknown
+        """
+        parameters = parameters or {}
+        missing = QueryLibrary.validate_parameters(query, parameters)
+        if missing:
+            raise ValueError(f"Missing parameters for {query.name}: {', '.join(missing)}")
+
+        text = QueryLibrary.with_label(query, label)
+        if query.read_only:
+            return await self._cached_read(text, parameters)
+        if query.auto_commit:
+            async with self._invalidating_reads(), self.session() as session:
+                result = await session.run(text, parameters)
+                return await result.data()
+        return await self.execute_query(text, parameters)
+
+    async def stream_query(
+        self,
+        query: str,
+        parameters: dict[str, Any] | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Execute a read query and yield records as they arrive.
+
+        Unlike execute_query, results are not buffered and transient
+        errors are not retried, since records may already have been yielded.
+
+        Args:
+            query: Cypher query string
+            parameters: Query parameters
+
+        Yields:
+            Result records as dictionaries
+        """
+        async with self.session(READ_ACCESS) as session:
+            result = await session.run(query, parameters or {})
+            async for record in result:
+                yield record.data()
 
     async def execute_write(
         self,
@@ -145,16 +730,8 @@ class Neo4jClient(LoggerMixin):
         Returns:
             Summary of the write operation
         """
-        async with self.session() as session:
-            result = await session.run(query, parameters or {})
-            summary = await result.consume()
-            return {
-                "nodes_created": summary.counters.nodes_created,
-                "nodes_deleted": summary.counters.nodes_deleted,
-                "relationships_created": summary.counters.relationships_created,
-                "relationships_deleted": summary.counters.relationships_deleted,
-                "properties_set": summary.counters.properties_set,
-            }
+        async with self._invalidating_reads(), self.session() as session:
+            return await session.execute_write(_write_counters, query, parameters or {})
 
     async def initialize_schema(self) -> None:
         """
@@ -164,22 +741,48 @@ class Neo4jClient(LoggerMixin):
         """
         self.log.info("initializing_schema")
 
-        # Create constraints
-        for statement in GraphSchema.get_constraint_creation_statements():
-            try:
-                await self.execute_write(statement)
-            except Exception as e:
-                self.log.warning("constraint_creation_warning", statement=statement, error=str(e))
-
-        # Create indexes
-        for statement in GraphSchema.get_index_creation_statements():
-            try:
-                await self.execute_write(statement)
-            except Exception as e:
-                self.log.warning("index_creation_warning", statement=statement, error=str(e))
+        # Indexes and uniqueness constraints work on every edition; creating
+        # them in one transaction takes the schema lock once
+        statements = GraphSchema.get_index_creation_statements()
+        try:
+            async with self.session() as session:
+                await session.execute_write(_run_statements, statements)
+        except Exception as e:
+            self.log.warning("schema_batch_failed", error=str(e))
+
+            # Fall back to one statement at a time so a single bad statement
+            # does not prevent the rest from being created
+            for statement in statements:
+                try:
+                    await self.execute_write(statement)
+                except Exception as e:
+                    self.log.warning("index_creation_warning", statement=statement, error=str(e))
+
+        # Property existence constraints are Enterprise-only
+        if await self._is_enterprise():
+            for statement in GraphSchema.get_constraint_creation_statements():
+                try:
+                    await self.execute_write(statement)
+                except Exception as e:
+                    self.log.warning(
+                        "constraint_creation_warning", statement=statement, error=str(e)
+                    )
+        else:
+            self.log.info("existence_constraints_skipped", reason="community_edition")
 
         self.log.info("schema_initialized")
 
+    async def _is_enterprise(self) -> bool:
+        """Check whether the server is a Neo4j Enterprise edition."""
+        try:
+            records = await self.execute_read(
+                "CALL dbms.components() YIELD edition RETURN edition"
+            )
+        except Exception as e:
+            self.log.warning("edition_check_failed", error=str(e))
+            return False
+        return any(record["edition"] == "enterprise" for record in records)
+
     async def clear_database(self) -> None:
         """
         Clear all nodes and relationships from the database.
@@ -211,14 +814,7 @@ class Neo4jClient(LoggerMixin):
             p.docstring = $docstring
         RETURN p.id as id
         """
-        params = {
-            "id": package.id,
-            "path": str(package.path),
-            "name": package.name,
-            "qualified_name": package.qualified_name,
-            "parent_id": package.parent_id,
-            "docstring": package.docstring,
-        }
+        params = _package_row(package)
         result = await self.execute_query(query, params)
         return result[0]["id"] if result else package.id
 
@@ -244,18 +840,9 @@ class Neo4jClient(LoggerMixin):
             m.last_modified = datetime()
         RETURN m.id as id
         """
-        params = {
-            "id": str(module.id),
-            "path": str(module.path),
-            "name": module.name,
-            "package": module.package,
-            "qualified_name": module.qualified_name,
-            "hash": module.hash,
-            "lines_of_code": module.lines_of_code,
-            "docstring": module.docstring,
-        }
+        params = _module_row(module)
         result = await self.execute_query(query, params)
-        return result[0]["id"] if result else str(module.id)
+        return result[0]["id"] if result else module.id
 
     async def create_class(self, cls: ClassInfo, parent_id: str) -> str:
         """
@@ -281,19 +868,9 @@ class Neo4jClient(LoggerMixin):
         MERGE (parent)-[:CONTAINS]->(c)
         RETURN c.id as id
         """
-        params = {
-            "parent_id": parent_id,
-            "id": str(cls.id),
-            "name": cls.name,
-            "qualified_name": cls.qualified_name,
-            "hash": "",  # Will be set by Merkle tree
-            "is_abstract": cls.is_abstract,
-            "bases": json.dumps(cls.bases),
-            "line_number": cls.location.line if cls.location else None,
-            "docstring": cls.docstring,
-        }
+        params = _class_row(cls, parent_id)
         result = await self.execute_query(query, params)
-        return result[0]["id"] if result else str(cls.id)
+        return result[0]["id"] if result else cls.id
 
     async def create_function(self, func: FunctionInfo, parent_id: str) -> str:
         """
@@ -326,26 +903,9 @@ class Neo4jClient(LoggerMixin):
         MERGE (parent)-[:CONTAINS]->(f)
         RETURN f.id as id
         """
-        params = {
-            "parent_id": parent_id,
-            "id": str(func.id),
-            "name": func.name,
-            "qualified_name": func.qualified_name,
-            "hash": func.body_hash,
-            "is_async": func.is_async,
-            "is_generator": func.is_generator,
-            "is_method": func.is_method,
-            "is_classmethod": func.is_classmethod,
-            "is_staticmethod": func.is_staticmethod,
-            "is_property": func.is_property,
-            "parameters": json.dumps([p.as_dict for p in func.parameters]),
-            "return_type": func.return_type,
-            "complexity": func.complexity,
-            "line_number": func.location.line if func.location else None,
-            "docstring": func.docstring,
-        }
+        params = _function_row(func, parent_id)
         result = await self.execute_query(query, params)
-        return result[0]["id"] if result else str(func.id)
+        return result[0]["id"] if result else func.id
 
     async def create_variable(self, var: VariableInfo, parent_id: str) -> str:
         """
@@ -370,18 +930,9 @@ class Neo4jClient(LoggerMixin):
         MERGE (parent)-[:CONTAINS]->(v)
         RETURN v.id as id
         """
-        params = {
-            "parent_id": parent_id,
-            "id": str(var.id),
-            "name": var.name,
-            "scope": var.scope,
-            "type_hint": var.type_hint,
-            "initial_value": var.initial_value,
-            "is_constant": var.is_constant,
-            "line_number": var.location.line if var.location else None,
-        }
+        params = _variable_row(var, parent_id)
         result = await self.execute_query(query, params)
-        return result[0]["id"] if result else str(var.id)
+        return result[0]["id"] if result else var.id
 
     async def create_relationship(self, rel: Relationship) -> None:
         """
@@ -390,21 +941,12 @@ class Neo4jClient(LoggerMixin):
         Args:
             rel: Relationship to create
         """
-        rel_type = rel.relationship_type.value.upper()
-        props = ", ".join(f"r.{k} = ${k}" for k in rel.properties.keys())
-
-        query = f"""
-        MATCH (source {{id: $source_id}})
-        MATCH (target {{id: $target_id}})
-        MERGE (source)-[r:{rel_type}]->(target)
-        {f'SET {props}' if props else ''}
-        """
         params = {
-            "source_id": str(rel.source_id),
-            "target_id": str(rel.target_id),
-            **rel.properties,
+            "source_id": rel.source_id,
+            "target_id": rel.target_id,
+            "properties": rel.properties,
         }
-        await self.execute_write(query, params)
+        await self.execute_write(_RELATIONSHIP_QUERIES[rel.relationship_type], params)
 
     # Bulk operations
 
@@ -418,56 +960,57 @@ class Neo4jClient(LoggerMixin):
         Returns:
             Number of packages created
         """
-        for package in packages:
-            await self.create_package(package)
-        
+        if not packages:
+            return 0
+
+        rows = [_package_row(package) for package in packages]
+        async with self._invalidating_reads(), self.session() as session:
+            await session.execute_write(_run_batched, [(_PACKAGE_ROWS_QUERY, rows)])
+
         self.log.info("bulk_packages_created", count=len(packages))
         return len(packages)
 
-    async def bulk_create_nodes(self, modules: list[ModuleInfo]) -> int:
+    async def bulk_create_nodes(self, modules: list[ModuleInfo], upsert: bool = True) -> int:
         """
         Bulk create nodes from parsed modules.
 
         Args:
             modules: List of ModuleInfo to create
+            upsert: MERGE on id so existing nodes are updated. Pass False only
+                when none of the nodes exist yet (e.g. right after
+                clear_database); nodes are then CREATEd without a lookup,
+                and existing ids fail the uniqueness constraints.
 
         Returns:
             Number of nodes created
         """
-        total_created = 0
-
-        for module in modules:
-            await self.create_module(module)
-            total_created += 1
-
-            for cls in module.classes:
-                await self._create_class_recursive(cls, str(module.id))
-                total_created += 1 + len(cls.methods) + len(cls.all_variables)
-
-            for func in module.functions:
-                await self.create_function(func, str(module.id))
-                total_created += 1
-
-            for var in module.variables:
-                await self.create_variable(var, str(module.id))
-                total_created += 1
-
+        # Modules own disjoint subtrees, so each group of modules can be
+        # written in its own transaction without contending for locks
+        groups = [
+            modules[start:start + _MODULES_PER_TRANSACTION]
+            for start in range(0, len(modules), _MODULES_PER_TRANSACTION)
+        ]
+        # Leave half the pool free for reads while a large write is running
+        semaphore = asyncio.Semaphore(max(1, self._settings.max_connection_pool_size // 2))
+
+        async def write_group(group: list[ModuleInfo]) -> int:
+            statements = _node_write_statements(group)
+            if not statements:
+                return 0
+            if not upsert:
+                statements = [(_CREATE_ONLY_QUERIES[query], rows) for query, rows in statements]
+
+            async with semaphore, self.session() as session:
+                await session.execute_write(_run_batched, statements)
+            return sum(len(rows) for _, rows in statements)
+
+        async with self._invalidating_reads(), asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(write_group(group)) for group in groups]
+
+        total_created = sum(task.result() for task in tasks)
         self.log.info("bulk_nodes_created", count=total_created)
         return total_created
 
-    async def _create_class_recursive(self, cls: ClassInfo, parent_id: str) -> None:
-        """Recursively create a class and its members."""
-        class_id = await self.create_class(cls, parent_id)
-
-        for method in cls.methods:
-            await self.create_function(method, class_id)
-
-        for var in cls.all_variables:
-            await self.create_variable(var, class_id)
-
-        for nested in cls.nested_classes:
-            await self._create_class_recursive(nested, class_id)
-
     async def bulk_create_relationships(self, relationships: list[Relationship]) -> int:
         """
         Bulk create relationships.
@@ -478,16 +1021,27 @@ class Neo4jClient(LoggerMixin):
         Returns:
             Number of relationships created
         """
+        # One UNWIND statement per relationship type instead of one per edge
+        rows_by_type: defaultdict[RelationshipType, list[dict[str, Any]]] = defaultdict(list)
         for rel in relationships:
-            try:
-                await self.create_relationship(rel)
-            except Exception as e:
-                self.log.warning(
-                    "relationship_creation_failed",
-                    source=str(rel.source_id),
-                    target=str(rel.target_id),
-                    error=str(e),
-                )
+            rows_by_type[rel.relationship_type].append({
+                "source_id": rel.source_id,
+                "target_id": rel.target_id,
+                "properties": rel.properties,
+            })
+
+        async with self._invalidating_reads(), self.session() as session:
+            for rel_type, rows in rows_by_type.items():
+                query = _RELATIONSHIP_ROWS_QUERIES[rel_type]
+                try:
+                    await session.execute_write(_run_batched, [(query, rows)])
+                except Exception as e:
+                    self.log.warning(
+                        "relationship_creation_failed",
+                        rel_type=rel_type.value,
+                        count=len(rows),
+                        error=str(e),
+                    )
 
         self.log.info("bulk_relationships_created", count=len(relationships))
         return len(relationships)
@@ -505,8 +1059,7 @@ class Neo4jClient(LoggerMixin):
         // Get root packages (packages without a parent package)
         MATCH (p:Package)
         WHERE p.parent_id = '' OR p.parent_id IS NULL
-        OPTIONAL MATCH (p)-[:CONTAINS]->(child)
-        WITH p as node, count(child) as child_count, 'package' as node_type
+        WITH p as node, COUNT { (p)-[:CONTAINS]->() } as child_count, 'package' as node_type
         RETURN node.id as id,
                node.name as name,
                node.path as path,
@@ -515,14 +1068,13 @@ class Neo4jClient(LoggerMixin):
                node.docstring as docstring,
                child_count,
                node_type as type
-        
+
         UNION ALL
-        
+
         // Get orphan modules (modules not contained in any package)
         MATCH (m:Module)
         WHERE NOT EXISTS { (:Package)-[:CONTAINS]->(m) }
-        OPTIONAL MATCH (m)-[:CONTAINS]->(child)
-        WITH m as node, count(child) as child_count, 'module' as node_type
+        WITH m as node, COUNT { (m)-[:CONTAINS]->() } as child_count, 'module' as node_type
         RETURN node.id as id,
                node.name as name,
                node.path as path,
@@ -531,55 +1083,42 @@ class Neo4jClient(LoggerMixin):
                node.docstring as docstring,
                child_count,
                node_type as type
-        
+
         ORDER BY type DESC, name
         """
-        return await self.execute_query(query)
+        return await self._cached_read(query, {})
 
-    async def get_node_children(self, node_id: str) -> list[dict[str, Any]]:
+    async def get_node_children(self, node_id: str, limit: int = 1000) -> list[dict[str, Any]]:
         """
         Get immediate children of a node.
 
         Args:
             node_id: ID of the parent node
+            limit: Maximum number of children to return
 
         Returns:
             List of child nodes with metadata
         """
-        query = """
-        MATCH (parent {id: $node_id})-[:CONTAINS]->(child)
-        OPTIONAL MATCH (child)-[:CONTAINS]->(grandchild)
-        WITH child, labels(child) as labels, count(grandchild) as child_count
-        RETURN child.id as id,
-               child.name as name,
-               child.qualified_name as qualified_name,
-               child.line_number as line_number,
-               child.docstring as docstring,
-               child_count,
-               CASE
-                   WHEN 'Package' IN labels THEN 'package'
-                   WHEN 'Module' IN labels THEN 'module'
-                   WHEN 'Class' IN labels THEN 'class'
-                   WHEN 'Function' IN labels THEN 'function'
-                   WHEN 'Variable' IN labels THEN 'variable'
-                   ELSE 'unknown'
-               END as type,
-               child.is_async as is_async,
-               child.is_method as is_method,
-               child.is_abstract as is_abstract,
-               child.complexity as complexity
-        ORDER BY
-            CASE
-                WHEN 'Package' IN labels THEN 0
-                WHEN 'Module' IN labels THEN 1
-                WHEN 'Class' IN labels THEN 2
-                WHEN 'Function' IN labels THEN 3
-                WHEN 'Variable' IN labels THEN 4
-                ELSE 5
-            END,
-            child.name, child.line_number
-        """
-        return await self.execute_query(query, {"node_id": node_id})
+        return await self._cached_read(
+            _NODE_CHILDREN_QUERY, {"node_id": node_id, "limit": limit}
+        )
+
+    async def get_node_children_stream(
+        self, node_id: str, limit: int = 1000
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream immediate children of a node as Neo4j returns them.
+
+        Args:
+            node_id: ID of the parent node
+            limit: Maximum number of children to return
+
+        Yields:
+            Child nodes with metadata, in the same order as get_node_children
+        """
+        params = {"node_id": node_id, "limit": limit}
+        async for record in self.stream_query(_NODE_CHILDREN_QUERY, params):
+            yield record
 
     async def get_node_ancestors(self, node_id: str) -> list[dict[str, Any]]:
         """
@@ -591,58 +1130,54 @@ class Neo4jClient(LoggerMixin):
         Returns:
             List of ancestor nodes from root to parent
         """
-        query = """
-        MATCH path = (root)-[:CONTAINS*0..]->(node {id: $node_id})
-        WHERE NOT ()-[:CONTAINS]->(root)
-        UNWIND nodes(path) as ancestor
-        WITH ancestor, labels(ancestor) as labels
-        RETURN ancestor.id as id,
-               ancestor.name as name,
-               ancestor.qualified_name as qualified_name,
-               CASE
-                   WHEN 'Module' IN labels THEN 'module'
-                   WHEN 'Class' IN labels THEN 'class'
-                   WHEN 'Function' IN labels THEN 'function'
-                   WHEN 'Variable' IN labels THEN 'variable'
-                   ELSE 'unknown'
-               END as type
-        """
-        return await self.execute_query(query, {"node_id": node_id})
-
-    async def search_nodes(self, query_text: str, limit: int = 50) -> list[dict[str, Any]]:
+        return await self.run_query(QueryLibrary.GET_ANCESTORS, {"node_id": node_id})
+
+    async def search_nodes(
+        self,
+        query_text: str,
+        limit: int = 50,
+        type_filter: str | None = None,
+        prefix: bool = False,
+    ) -> list[dict[str, Any]]:
         """
         Full-text search across all node names.
 
         Args:
             query_text: Search query
             limit: Maximum results to return
+            type_filter: Optional node type (package, module, class, function, variable)
+            prefix: Match names starting with the query instead of fuzzy matching
 
         Returns:
             List of matching nodes with scores
         """
-        # Escape special characters for Lucene query
-        escaped = query_text.replace("~", "\\~").replace("*", "\\*")
+        label = None
+        if type_filter:
+            label = _TYPE_TO_LABEL.get(type_filter.lower())
+            if label is None:
+                return []
+
+        # User text is matched literally; only the trailing operator is syntax
+        escaped = query_text.translate(_LUCENE_ESCAPE)
+        search_text = f"{escaped}*" if prefix else f"{escaped}~"
 
         query = """
         CALL db.index.fulltext.queryNodes('node_name_search', $search_text)
         YIELD node, score
         WITH node, score, labels(node) as labels
+        WHERE $label IS NULL OR $label IN labels
         RETURN node.id as id,
                node.name as name,
                node.qualified_name as qualified_name,
                node.line_number as line_number,
                score,
-               CASE
-                   WHEN 'Module' IN labels THEN 'module'
-                   WHEN 'Class' IN labels THEN 'class'
-                   WHEN 'Function' IN labels THEN 'function'
-                   WHEN 'Variable' IN labels THEN 'variable'
-                   ELSE 'unknown'
-               END as type
+               coalesce(toLower(head(labels)), 'unknown') as type
         ORDER BY score DESC
         LIMIT $limit
         """
-        return await self.execute_query(query, {"search_text": f"{escaped}~", "limit": limit})
+        return await self.execute_read(
+            query, {"search_text": search_text, "limit": limit, "label": label}
+        )
 
     async def get_node_references(self, node_id: str) -> list[dict[str, Any]]:
         """
@@ -654,25 +1189,20 @@ class Neo4jClient(LoggerMixin):
         Returns:
             List of related nodes with relationship types
         """
-        query = """
-        MATCH (node {id: $node_id})-[r]-(related)
-        WHERE NOT type(r) = 'CONTAINS'
-        WITH related, type(r) as rel_type, labels(related) as labels,
-             CASE WHEN startNode(r) = node THEN 'outgoing' ELSE 'incoming' END as direction
-        RETURN related.id as id,
-               related.name as name,
-               related.qualified_name as qualified_name,
-               rel_type,
-               direction,
-               CASE
-                   WHEN 'Module' IN labels THEN 'module'
-                   WHEN 'Class' IN labels THEN 'class'
-                   WHEN 'Function' IN labels THEN 'function'
-                   WHEN 'Variable' IN labels THEN 'variable'
-                   ELSE 'unknown'
-               END as type
+        return await self.execute_read(_NODE_REFERENCES_QUERY, {"node_id": node_id})
+
+    async def get_node_references_stream(self, node_id: str) -> AsyncIterator[dict[str, Any]]:
         """
-        return await self.execute_query(query, {"node_id": node_id})
+        Stream nodes related to this node as Neo4j returns them.
+
+        Args:
+            node_id: ID of the node
+
+        Yields:
+            Related nodes with relationship types
+        """
+        async for record in self.stream_query(_NODE_REFERENCES_QUERY, {"node_id": node_id}):
+            yield record
 
     async def get_node_by_id(self, node_id: str) -> dict[str, Any] | None:
         """
@@ -687,13 +1217,12 @@ class Neo4jClient(LoggerMixin):
         query = """
         MATCH (n {id: $node_id})
         WITH n, labels(n) as labels
-        OPTIONAL MATCH (n)-[:CONTAINS]->(child)
-        WITH n, labels, count(child) as child_count
+        WITH n, labels, COUNT { (n)-[:CONTAINS]->() } as child_count
         RETURN n as node,
                labels,
                child_count
         """
-        result = await self.execute_query(query, {"node_id": node_id})
+        result = await self.execute_read(query, {"node_id": node_id})
         if not result:
             return None
 
@@ -713,16 +1242,32 @@ class Neo4jClient(LoggerMixin):
         Returns:
             Number of nodes deleted
         """
-        query = """
-        MATCH (m:Module {path: $path})
-        OPTIONAL MATCH (m)-[:CONTAINS*]->(descendant)
-        WITH m, collect(descendant) as descendants
-        UNWIND [m] + descendants as node
-        DETACH DELETE node
-        RETURN count(*) as deleted_count
+        return await self.bulk_delete_modules([module_path])
+
+    async def bulk_delete_modules(self, module_paths: list[str]) -> int:
+        """
+        Delete several modules and all their descendants.
+
+        Descendants are deleted in batches of _WRITE_BATCH_SIZE, each in its
+        own transaction, so large modules never build one huge transaction.
+
+        Args:
+            module_paths: Paths of the modules to delete
+
+        Returns:
+            Number of nodes deleted
         """
-        result = await self.execute_query(query, {"path": module_path})
-        return result[0]["deleted_count"] if result else 0
+        if not module_paths:
+            return 0
+
+        params = {"paths": module_paths}
+        deleted = 0
+        async with self._invalidating_reads(), self.session() as session:
+            for query in (_DELETE_DESCENDANTS_QUERY, _DELETE_MODULES_QUERY):
+                result = await session.run(query, params)
+                record = await result.single()
+                deleted += record["deleted_count"] if record else 0
+        return deleted
 
     async def update_node_hash(self, node_id: str, new_hash: str) -> None:
         """
@@ -741,13 +1286,13 @@ class Neo4jClient(LoggerMixin):
     async def expand_node(self, node_id: str) -> dict[str, Any]:
         """
         Get a node with all its outgoing connections for incremental loading.
-        
-        Returns the node, its direct children (via CONTAINS), 
+
+        Returns the node, its direct children (via CONTAINS),
         and outgoing edges (CALLS, IMPORTS, INHERITS).
-        
+
         Args:
             node_id: Hierarchical ID of the node to expand
-        
+
         Returns:
             Dictionary containing:
             - node: The expanded node
@@ -757,85 +1302,60 @@ class Neo4jClient(LoggerMixin):
         """
         query = """
         MATCH (n {id: $node_id})
-        WITH n, labels(n) as node_labels
-        
-        // Get children via CONTAINS with grandchild counts
-        OPTIONAL MATCH (n)-[:CONTAINS]->(child)
-        OPTIONAL MATCH (child)-[:CONTAINS]->(grandchild)
-        WITH n, node_labels, child, count(grandchild) as grandchild_count
-        WITH n, node_labels, collect({
-            id: child.id,
-            name: child.name,
-            type: CASE
-                WHEN 'Package' IN labels(child) THEN 'Package'
-                WHEN 'Module' IN labels(child) THEN 'Module'
-                WHEN 'Class' IN labels(child) THEN 'Class'
-                WHEN 'Function' IN labels(child) THEN 'Function'
-                WHEN 'Variable' IN labels(child) THEN 'Variable'
-                ELSE head(labels(child))
-            END,
-            qualified_name: child.qualified_name,
-            line_number: child.line_number,
-            docstring: child.docstring,
-            is_async: child.is_async,
-            complexity: child.complexity,
-            child_count: grandchild_count
-        }) as children
-        
-        // Get outgoing relationships (CALLS, IMPORTS, INHERITS)
-        OPTIONAL MATCH (n)-[r]->(target)
-        WHERE type(r) IN ['CALLS', 'IMPORTS', 'INHERITS', 'INSTANTIATES']
-        WITH n, node_labels, children, collect({
-            target_id: target.id,
-            target_name: target.name,
-            target_type: CASE
-                WHEN 'Package' IN labels(target) THEN 'Package'
-                WHEN 'Module' IN labels(target) THEN 'Module'
-                WHEN 'Class' IN labels(target) THEN 'Class'
-                WHEN 'Function' IN labels(target) THEN 'Function'
-                WHEN 'Variable' IN labels(target) THEN 'Variable'
-                ELSE head(labels(target))
-            END,
-            edge_type: type(r),
-            properties: properties(r)
-        }) as outgoing
-        
         RETURN n as node,
-               node_labels as labels,
-               [c IN children WHERE c.id IS NOT NULL] as children,
-               [o IN outgoing WHERE o.target_id IS NOT NULL] as outgoing
-        """
-        result = await self.execute_query(query, {"node_id": node_id})
-        
+               labels(n) as labels,
+               // Children via CONTAINS with grandchild counts
+               [(n)-[:CONTAINS]->(child) | {
+                   id: child.id,
+                   name: child.name,
+                   type: coalesce(toLower(head(labels(child))), 'unknown'),
+                   qualified_name: child.qualified_name,
+                   line_number: child.line_number,
+                   docstring: child.docstring,
+                   is_async: child.is_async,
+                   complexity: child.complexity,
+                   child_count: COUNT { (child)-[:CONTAINS]->() }
+               }] as children,
+               // Outgoing relationships (CALLS, IMPORTS, INHERITS)
+               [(n)-[r:CALLS|IMPORTS|INHERITS|INSTANTIATES]->(target) | {
+                   target_id: target.id,
+                   target_name: target.name,
+                   target_type: head(labels(target)),
+                   edge_type: type(r),
+                   properties: properties(r)
+               }] as outgoing
+        """
+        result = await self._cached_read(query, {"node_id": node_id})
+
         if not result:
             return {"node": None, "children": [], "outgoing": [], "edges": []}
-        
+
         record = result[0]
         node_data = dict(record["node"]) if record["node"] else {}
         node_data["labels"] = record["labels"]
-        
+
         return {
             "node": node_data,
             "children": record["children"],
             "outgoing": record["outgoing"],
         }
-    
+
     async def get_children_paginated(
-        self, 
-        node_id: str, 
-        limit: int = 50, 
+        self,
+        node_id: str,
+        limit: int = 50,
         offset: int = 0,
         type_filter: str | None = None,
     ) -> dict[str, Any]:
         """
         Get paginated children of a node.
-        
+
         Args:
             node_id: ID of the parent node
             limit: Maximum number of results
             offset: Number of results to skip
             type_filter: Optional filter by node type (package, module, class, function, variable)
-        
+
         Returns:
             Dictionary containing:
             - children: List of child nodes
@@ -843,23 +1363,14 @@ class Neo4jClient(LoggerMixin):
             - has_more: Whether there are more results
         """
         type_clause = ""
-        if type_filter:
-            type_map = {
-                "package": "Package",
-                "module": "Module", 
-                "class": "Class",
-                "function": "Function",
-                "variable": "Variable",
-            }
-            if type_filter.lower() in type_map:
-                type_clause = f"AND '{type_map[type_filter.lower()]}' IN labels(child)"
-        
+        if type_filter and type_filter.lower() in _TYPE_TO_LABEL:
+            type_clause = f"AND '{_TYPE_TO_LABEL[type_filter.lower()]}' IN labels(child)"
+
         query = f"""
         MATCH (parent {{id: $node_id}})-[:CONTAINS]->(child)
         WHERE true {type_clause}
         WITH child, labels(child) as labels
-        OPTIONAL MATCH (child)-[:CONTAINS]->(grandchild)
-        WITH child, labels, count(grandchild) as child_count
+        WITH child, labels, COUNT {{ (child)-[:CONTAINS]->() }} as child_count
         WITH collect({{
             id: child.id,
             name: child.name,
@@ -867,14 +1378,7 @@ class Neo4jClient(LoggerMixin):
             line_number: child.line_number,
             docstring: child.docstring,
             child_count: child_count,
-            type: CASE
-                WHEN 'Package' IN labels THEN 'package'
-                WHEN 'Module' IN labels THEN 'module'
-                WHEN 'Class' IN labels THEN 'class'
-                WHEN 'Function' IN labels THEN 'function'
-                WHEN 'Variable' IN labels THEN 'variable'
-                ELSE 'unknown'
-            END,
+            type: coalesce(toLower(head(labels)), 'unknown'),
             is_async: child.is_async,
             is_method: child.is_method,
             is_abstract: child.is_abstract,
@@ -883,25 +1387,25 @@ class Neo4jClient(LoggerMixin):
         RETURN size(all_children) as total,
                all_children[$offset..$offset + $limit] as children
         """
-        result = await self.execute_query(query, {
-            "node_id": node_id, 
-            "limit": limit, 
+        result = await self.execute_read(query, {
+            "node_id": node_id,
+            "limit": limit,
             "offset": offset
         })
-        
+
         if not result:
             return {"children": [], "total": 0, "has_more": False}
-        
+
         record = result[0]
         total = record["total"]
         children = record["children"]
-        
+
         return {
             "children": children,
             "total": total,
             "has_more": offset + len(children) < total,
         }
-    
+
     async def get_nodes_at_depth(
         self,
         root_id: str,
@@ -910,12 +1414,12 @@ class Neo4jClient(LoggerMixin):
     ) -> list[dict[str, Any]]:
         """
         Get all nodes at a specific depth from a root node.
-        
+
         Args:
             root_id: ID of the root node (or empty for absolute root)
             depth: Depth level (1 = direct children, 2 = grandchildren, etc.)
             limit: Maximum number of results
-        
+
         Returns:
             List of nodes at the specified depth
         """
@@ -923,28 +1427,20 @@ class Neo4jClient(LoggerMixin):
             query = """
             MATCH (root {id: $root_id})-[:CONTAINS*""" + str(depth) + """]->(node)
             WITH node, labels(node) as labels
-            OPTIONAL MATCH (node)-[:CONTAINS]->(child)
-            WITH node, labels, count(child) as child_count
+            WITH node, labels, COUNT { (node)-[:CONTAINS]->() } as child_count
             RETURN node.id as id,
                    node.name as name,
                    node.qualified_name as qualified_name,
                    node.docstring as docstring,
                    child_count,
-                   CASE
-                       WHEN 'Package' IN labels THEN 'package'
-                       WHEN 'Module' IN labels THEN 'module'
-                       WHEN 'Class' IN labels THEN 'class'
-                       WHEN 'Function' IN labels THEN 'function'
-                       WHEN 'Variable' IN labels THEN 'variable'
-                       ELSE 'unknown'
-                   END as type
+                   coalesce(toLower(head(labels)), 'unknown') as type
             LIMIT $limit
             """
-            return await self.execute_query(query, {"root_id": root_id, "limit": limit})
+            return await self.execute_read(query, {"root_id": root_id, "limit": limit})
         else:
             # Get root-level nodes if no root_id
             return await self.get_root_nodes()
-    
+
     async def get_subtree(
         self,
         root_id: str,
@@ -953,14 +1449,14 @@ class Neo4jClient(LoggerMixin):
     ) -> dict[str, Any]:
         """
         Get a subtree starting from a node up to a maximum depth.
-        
+
         Useful for preloading visible portions of the tree.
-        
+
         Args:
             root_id: ID of the root node
             max_depth: Maximum depth to traverse
             limit_per_level: Maximum children per node
-        
+
         Returns:
             Dictionary containing the node and its nested children
         """
@@ -975,33 +1471,20 @@ class Neo4jClient(LoggerMixin):
             name: descendant.name,
             qualified_name: descendant.qualified_name,
             depth: depth,
-            type: CASE
-                WHEN 'Package' IN desc_labels THEN 'package'
-                WHEN 'Module' IN desc_labels THEN 'module'
-                WHEN 'Class' IN desc_labels THEN 'class'
-                WHEN 'Function' IN desc_labels THEN 'function'
-                WHEN 'Variable' IN desc_labels THEN 'variable'
-                ELSE 'unknown'
-            END,
+            type: coalesce(toLower(head(desc_labels)), 'unknown'),
             docstring: descendant.docstring,
             line_number: descendant.line_number
         }) as descendants
         RETURN root.id as id,
                root.name as name,
-               CASE
-                   WHEN 'Package' IN root_labels THEN 'package'
-                   WHEN 'Module' IN root_labels THEN 'module'
-                   WHEN 'Class' IN root_labels THEN 'class'
-                   WHEN 'Function' IN root_labels THEN 'function'
-                   ELSE 'unknown'
-               END as type,
+               coalesce(toLower(head(root_labels)), 'unknown') as type,
                descendants
         """
-        result = await self.execute_query(query, {"root_id": root_id})
-        
+        result = await self.execute_read(query, {"root_id": root_id})
+
         if not result:
             return {"id": root_id, "name": "", "type": "unknown", "children": []}
-        
+
         record = result[0]
         return {
             "id": record["id"],
@@ -1013,43 +1496,35 @@ class Neo4jClient(LoggerMixin):
     async def get_node_connections(self, node_id: str) -> list[dict[str, Any]]:
         """
         Get all nodes that this node connects to (outgoing) and are connected from (incoming).
-        
+
         Excludes CONTAINS relationships.
-        
+
         Args:
             node_id: ID of the node
-        
+
         Returns:
             List of connected nodes with edge information
         """
         query = """
         MATCH (n {id: $node_id})
-        OPTIONAL MATCH (n)-[out]->(target)
-        WHERE NOT type(out) IN ['CONTAINS']
-        WITH n, collect({
-            id: target.id,
-            name: target.name,
-            type: head(labels(target)),
-            qualified_name: target.qualified_name,
-            edge_type: type(out),
-            direction: 'outgoing',
-            line_number: target.line_number
-        }) as outgoing
-        
-        OPTIONAL MATCH (source)-[inc]->(n)
-        WHERE NOT type(inc) IN ['CONTAINS']
-        WITH outgoing, collect({
-            id: source.id,
-            name: source.name,
-            type: head(labels(source)),
-            qualified_name: source.qualified_name,
-            edge_type: type(inc),
-            direction: 'incoming',
-            line_number: source.line_number
-        }) as incoming
-        
-        RETURN [c IN outgoing + incoming WHERE c.id IS NOT NULL] as connections
-        """
-        result = await self.execute_query(query, {"node_id": node_id})
+        RETURN [(n)-[out]->(target) WHERE type(out) <> 'CONTAINS' | {
+                   id: target.id,
+                   name: target.name,
+                   type: head(labels(target)),
+                   qualified_name: target.qualified_name,
+                   edge_type: type(out),
+                   direction: 'outgoing',
+                   line_number: target.line_number
+               }] + [(source)-[inc]->(n) WHERE type(inc) <> 'CONTAINS' | {
+                   id: source.id,
+                   name: source.name,
+                   type: head(labels(source)),
+                   qualified_name: source.qualified_name,
+                   edge_type: type(inc),
+                   direction: 'incoming',
+                   line_number: source.line_number
+               }] as connections
+        """
+        result = await self.execute_read(query, {"node_id": node_id})
         return result[0]["connections"] if result else []
 
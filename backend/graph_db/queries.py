@@ -5,11 +5,21 @@ Optimized Cypher queries for common graph operations.
 Requires Python 3.11+.
 """
 
-from dataclasses import dataclass
+import re
+import sys
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from functools import cache
+from types import MappingProxyType
 from typing import Any
 
+from graph_db.schema import NodeLabel, RelationshipLabel
 
-@dataclass(frozen=True)
+# Runs of whitespace, collapsed when normalizing query text
+_WHITESPACE = re.compile(r"\s+")
+
+
+@dataclass(frozen=True, slots=True)
 class CypherQuery:
     """A named Cypher query with description."""
 
@@ -17,6 +27,52 @@ class CypherQuery:
     description: str
     query: str
     parameters: tuple[str, ...]
+    # Variable matched by {id: $node_id} that accepts a label at call time
+    label_variable: str | None = None
+    # Read-only results may be served from the client's result cache
+    read_only: bool = True
+    # Commits its own batches (CALL { } IN TRANSACTIONS), so it must run in
+    # an auto-commit transaction rather than a managed one
+    auto_commit: bool = False
+    # Query text with whitespace collapsed; what run_query sends and caches
+    # results under. Query text must not hold // comments or
+    # whitespace-sensitive literals.
+    normalized: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Interned so cache keys built from query text compare by identity
+        object.__setattr__(self, "query", sys.intern(self.query))
+        object.__setattr__(
+            self, "normalized", sys.intern(_WHITESPACE.sub(" ", self.query).strip())
+        )
+
+
+# Labels that carry an indexed name property, searched one arm at a time
+_NAMED_LABELS = (
+    NodeLabel.PACKAGE,
+    NodeLabel.MODULE,
+    NodeLabel.CLASS,
+    NodeLabel.FUNCTION,
+    NodeLabel.VARIABLE,
+)
+
+# Relationship types that count as references (everything but CONTAINS)
+_REFERENCE_TYPES = "|".join(
+    label.value for label in RelationshipLabel if label is not RelationshipLabel.CONTAINS
+)
+
+
+@cache
+def _labelled_query(query: CypherQuery, label: NodeLabel) -> str:
+    """Expand a query with its id-matched variable restricted to a label."""
+    pattern = f"({query.label_variable} {{id: $node_id}})"
+    if pattern not in query.normalized:
+        raise ValueError(f"Query {query.name} has no {pattern} pattern")
+    return sys.intern(
+        query.normalized.replace(
+            pattern, f"({query.label_variable}:{label.value} {{id: $node_id}})", 1
+        )
+    )
 
 
 class QueryLibrary:
@@ -24,6 +80,8 @@ class QueryLibrary:
     Library of optimized Cypher queries.
 
     All queries are designed for sub-50ms execution with proper indexes.
+    Listing queries return at most $docstring_length characters of each
+    docstring (0 for none); GET_NODE_DOCSTRING fetches the full text.
     """
 
     # Root and navigation queries
@@ -33,19 +91,18 @@ class QueryLibrary:
         description="Get all top-level modules with child counts",
         query="""
         MATCH (m:Module)
-        OPTIONAL MATCH (m)-[:CONTAINS]->(child)
-        WITH m, count(child) as child_count
+        WITH m, COUNT { (m)-[:CONTAINS]->() } as child_count
         RETURN m.id as id,
                m.name as name,
                m.path as path,
                m.qualified_name as qualified_name,
                m.lines_of_code as lines_of_code,
-               m.docstring as docstring,
+               left(m.docstring, $docstring_length) as docstring,
                child_count,
                'module' as type
         ORDER BY m.name
         """,
-        parameters=(),
+        parameters=("docstring_length",),
     )
 
     GET_NODE_BY_ID = CypherQuery(
@@ -54,8 +111,7 @@ class QueryLibrary:
         query="""
         MATCH (n {id: $node_id})
         WITH n, labels(n) as labels
-        OPTIONAL MATCH (n)-[:CONTAINS]->(child)
-        WITH n, labels, count(child) as child_count
+        WITH n, labels, COUNT { (n)-[:CONTAINS]->() } as child_count
         OPTIONAL MATCH (parent)-[:CONTAINS]->(n)
         RETURN properties(n) as props,
                labels,
@@ -63,6 +119,7 @@ class QueryLibrary:
                parent.id as parent_id
         """,
         parameters=("node_id",),
+        label_variable="n",
     )
 
     GET_CHILDREN = CypherQuery(
@@ -70,111 +127,138 @@ class QueryLibrary:
         description="Get immediate children of a node ordered by type and line",
         query="""
         MATCH (parent {id: $node_id})-[:CONTAINS]->(child)
-        OPTIONAL MATCH (child)-[:CONTAINS]->(grandchild)
-        WITH child, labels(child) as labels, count(grandchild) as child_count
+        WITH child, labels(child) as labels
+        WITH child, labels,
+             CASE
+                 WHEN 'Class' IN labels THEN 0
+                 WHEN 'Function' IN labels THEN 1
+                 WHEN 'Variable' IN labels THEN 2
+                 ELSE 3
+             END as sort_order
+        ORDER BY sort_order, child.line_number
+        LIMIT $limit
         RETURN child.id as id,
                child.name as name,
                child.qualified_name as qualified_name,
                child.line_number as line_number,
-               child.docstring as docstring,
-               child_count,
+               left(child.docstring, $docstring_length) as docstring,
+               COUNT { (child)-[:CONTAINS]->() } as child_count,
                labels,
-               CASE
-                   WHEN 'Module' IN labels THEN 'module'
-                   WHEN 'Class' IN labels THEN 'class'
-                   WHEN 'Function' IN labels THEN 'function'
-                   WHEN 'Variable' IN labels THEN 'variable'
-                   ELSE 'unknown'
-               END as type,
+               coalesce(toLower(head(labels)), 'unknown') as type,
                child.is_async as is_async,
                child.is_method as is_method,
                child.is_abstract as is_abstract,
                child.complexity as complexity,
                child.return_type as return_type,
                child.type_hint as type_hint
-        ORDER BY
-            CASE
-                WHEN 'Class' IN labels THEN 0
-                WHEN 'Function' IN labels THEN 1
-                WHEN 'Variable' IN labels THEN 2
-                ELSE 3
-            END,
-            child.line_number
-        LIMIT $limit
+        ORDER BY sort_order, line_number
         """,
-        parameters=("node_id", "limit"),
+        parameters=("node_id", "limit", "docstring_length"),
+        label_variable="parent",
+    )
+
+    GET_NODE_DOCSTRING = CypherQuery(
+        name="get_node_docstring",
+        description="Get the full docstring of a node, fetched on demand",
+        query="""
+        MATCH (n {id: $node_id})
+        RETURN n.docstring as docstring
+        """,
+        parameters=("node_id",),
+        label_variable="n",
     )
 
     GET_ANCESTORS = CypherQuery(
         name="get_ancestors",
         description="Get path from root to node (breadcrumbs)",
         query="""
-        MATCH path = (root)-[:CONTAINS*0..]->(node {id: $node_id})
+        MATCH path = (node {id: $node_id})<-[:CONTAINS*0..]-(root:Package|Module)
         WHERE NOT ()-[:CONTAINS]->(root)
-        WITH nodes(path) as ancestors
+        WITH reverse(nodes(path)) as ancestors
         UNWIND range(0, size(ancestors)-1) as idx
-        WITH ancestors[idx] as ancestor, idx, labels(ancestors[idx]) as labels
+        WITH ancestors[idx] as ancestor, idx
         RETURN ancestor.id as id,
                ancestor.name as name,
                ancestor.qualified_name as qualified_name,
                idx as depth,
-               CASE
-                   WHEN 'Module' IN labels THEN 'module'
-                   WHEN 'Class' IN labels THEN 'class'
-                   WHEN 'Function' IN labels THEN 'function'
-                   ELSE 'unknown'
-               END as type
+               coalesce(toLower(head(labels(ancestor))), 'unknown') as type
         ORDER BY idx
         """,
         parameters=("node_id",),
+        label_variable="node",
+    )
+
+    # Node, breadcrumbs and first page of children in one round-trip; both
+    # subqueries aggregate so they return a row even when empty
+    GET_NODE_PAGE = CypherQuery(
+        name="get_node_page",
+        description="Get a node with its breadcrumbs and children for one navigation step",
+        query="""
+        MATCH (n {id: $node_id})
+        CALL {
+            WITH n
+            MATCH path = (n)<-[:CONTAINS*0..]-(root:Package|Module)
+            WHERE NOT ()-[:CONTAINS]->(root)
+            RETURN coalesce(head(collect([a IN reverse(nodes(path)) | a {
+                       .id, .name, .qualified_name,
+                       type: coalesce(toLower(head(labels(a))), 'unknown')
+                   }])), []) as breadcrumbs
+        }
+        CALL {
+            WITH n
+            OPTIONAL MATCH (n)-[:CONTAINS]->(child)
+            WITH child ORDER BY child.line_number
+            LIMIT $limit
+            RETURN collect(child {
+                       .id, .name, .qualified_name, .line_number,
+                       type: coalesce(toLower(head(labels(child))), 'unknown'),
+                       child_count: COUNT { (child)-[:CONTAINS]->() }
+                   }) as children
+        }
+        RETURN properties(n) as props,
+               labels(n) as labels,
+               breadcrumbs,
+               children
+        """,
+        parameters=("node_id", "limit"),
+        label_variable="n",
     )
 
     # Search queries
 
+    # Lucene keeps only the top $limit hits, already in score order
     SEARCH_FULLTEXT = CypherQuery(
         name="search_fulltext",
         description="Full-text search across node names",
         query="""
-        CALL db.index.fulltext.queryNodes('node_name_search', $search_text)
+        CALL db.index.fulltext.queryNodes('node_name_search', $search_text, {limit: $limit})
         YIELD node, score
-        WITH node, score, labels(node) as labels
-        WHERE score > 0.1
         RETURN node.id as id,
                node.name as name,
                node.qualified_name as qualified_name,
                node.line_number as line_number,
-               node.docstring as docstring,
+               left(node.docstring, $docstring_length) as docstring,
                score,
-               CASE
-                   WHEN 'Module' IN labels THEN 'module'
-                   WHEN 'Class' IN labels THEN 'class'
-                   WHEN 'Function' IN labels THEN 'function'
-                   WHEN 'Variable' IN labels THEN 'variable'
-                   ELSE 'unknown'
-               END as type
-        ORDER BY score DESC
-        LIMIT $limit
+               coalesce(toLower(head(labels(node))), 'unknown') as type
         """,
-        parameters=("search_text", "limit"),
+        parameters=("search_text", "limit", "docstring_length"),
     )
 
     SEARCH_EXACT_NAME = CypherQuery(
         name="search_exact_name",
-        description="Search for exact node name match",
+        description="Search for exact node name match (one name index seek per label)",
         query="""
-        MATCH (n)
-        WHERE n.name = $name
-        WITH n, labels(n) as labels
+        CALL {
+            """ + "\n            UNION ALL\n            ".join(
+                f"MATCH (n:{label.value} {{name: $name}}) "
+                f"RETURN n, '{label.value.lower()}' as type"
+                for label in _NAMED_LABELS
+            ) + """
+        }
         RETURN n.id as id,
                n.name as name,
                n.qualified_name as qualified_name,
-               CASE
-                   WHEN 'Module' IN labels THEN 'module'
-                   WHEN 'Class' IN labels THEN 'class'
-                   WHEN 'Function' IN labels THEN 'function'
-                   WHEN 'Variable' IN labels THEN 'variable'
-                   ELSE 'unknown'
-               END as type
+               type
         LIMIT $limit
         """,
         parameters=("name", "limit"),
@@ -186,28 +270,28 @@ class QueryLibrary:
         name="get_references",
         description="Get all nodes referencing or referenced by a node",
         query="""
-        MATCH (node {id: $node_id})-[r]-(related)
-        WHERE NOT type(r) = 'CONTAINS'
-        WITH related, type(r) as rel_type, labels(related) as labels,
-             CASE WHEN startNode(r) = node THEN 'outgoing' ELSE 'incoming' END as direction,
-             properties(r) as rel_props
+        MATCH (node {id: $node_id})
+        CALL {
+            WITH node
+            MATCH (node)-[r:""" + _REFERENCE_TYPES + """]->(related)
+            RETURN related, r, 'outgoing' as direction
+            UNION ALL
+            WITH node
+            MATCH (node)<-[r:""" + _REFERENCE_TYPES + """]-(related)
+            RETURN related, r, 'incoming' as direction
+        }
         RETURN related.id as id,
                related.name as name,
                related.qualified_name as qualified_name,
                related.line_number as line_number,
-               rel_type,
+               type(r) as rel_type,
                direction,
-               rel_props,
-               CASE
-                   WHEN 'Module' IN labels THEN 'module'
-                   WHEN 'Class' IN labels THEN 'class'
-                   WHEN 'Function' IN labels THEN 'function'
-                   WHEN 'Variable' IN labels THEN 'variable'
-                   ELSE 'unknown'
-               END as type
-        ORDER BY rel_type, direction, related.name
+               properties(r) as rel_props,
+               coalesce(toLower(head(labels(related))), 'unknown') as type
+        ORDER BY rel_type, direction, name
         """,
         parameters=("node_id",),
+        label_variable="node",
     )
 
     GET_CALLERS = CypherQuery(
@@ -244,15 +328,13 @@ class QueryLibrary:
         name="get_inheritance_tree",
         description="Get class inheritance hierarchy",
         query="""
-        MATCH path = (cls:Class {id: $node_id})-[:INHERITS*0..10]->(base:Class)
-        UNWIND nodes(path) as node
+        MATCH (cls:Class {id: $node_id})-[:INHERITS*0..10]->(node:Class)
         WITH DISTINCT node
-        OPTIONAL MATCH (child:Class)-[:INHERITS]->(node)
         RETURN node.id as id,
                node.name as name,
                node.qualified_name as qualified_name,
                node.is_abstract as is_abstract,
-               collect(DISTINCT child.id) as subclasses
+               COLLECT { MATCH (child:Class)-[:INHERITS]->(node) RETURN DISTINCT child.id } as subclasses
         """,
         parameters=("node_id",),
     )
@@ -264,22 +346,21 @@ class QueryLibrary:
         description="Get statistics for a module",
         query="""
         MATCH (m:Module {id: $node_id})
-        OPTIONAL MATCH (m)-[:CONTAINS*]->(cls:Class)
-        OPTIONAL MATCH (m)-[:CONTAINS*]->(func:Function)
-        OPTIONAL MATCH (m)-[:CONTAINS*]->(var:Variable)
         RETURN m.lines_of_code as lines_of_code,
-               count(DISTINCT cls) as class_count,
-               count(DISTINCT func) as function_count,
-               count(DISTINCT var) as variable_count
+               COUNT { (m)-[:CONTAINS*]->(:Class) } as class_count,
+               COUNT { (m)-[:CONTAINS*]->(:Function) } as function_count,
+               COUNT { (m)-[:CONTAINS*]->(:Variable) } as variable_count
         """,
         parameters=("node_id",),
     )
 
+    # Pinned to function_complexity_idx, created by GraphSchema
     GET_COMPLEXITY_HOTSPOTS = CypherQuery(
         name="get_complexity_hotspots",
         description="Get functions with highest complexity",
         query="""
         MATCH (f:Function)
+        USING INDEX f:Function(complexity)
         WHERE f.complexity > 5
         RETURN f.id as id,
                f.name as name,
@@ -303,20 +384,23 @@ class QueryLibrary:
         RETURN n.id as id
         """,
         parameters=("node_id", "hash"),
+        label_variable="n",
+        read_only=False,
     )
 
+    # Deletes deepest first, so the module itself goes in the last batch
     DELETE_MODULE_CASCADE = CypherQuery(
         name="delete_module_cascade",
         description="Delete a module and all descendants",
         query="""
-        MATCH (m:Module {path: $path})
-        OPTIONAL MATCH (m)-[:CONTAINS*]->(descendant)
-        WITH m, collect(descendant) as descendants
-        UNWIND [m] + descendants as node
-        DETACH DELETE node
+        MATCH path = (:Module {path: $path})-[:CONTAINS*0..]->(node)
+        WITH node ORDER BY length(path) DESC
+        CALL { WITH node DETACH DELETE node } IN TRANSACTIONS OF 1000 ROWS
         RETURN count(*) as deleted_count
         """,
         parameters=("path",),
+        read_only=False,
+        auto_commit=True,
     )
 
     # Batch operations
@@ -326,12 +410,13 @@ class QueryLibrary:
         description="Batch create CONTAINS relationships",
         query="""
         UNWIND $relationships as rel
-        MATCH (parent {id: rel.parent_id})
-        MATCH (child {id: rel.child_id})
+        MATCH (parent:Package|Module|Class|Function {id: rel.parent_id})
+        MATCH (child:Package|Module|Class|Function|Variable {id: rel.child_id})
         MERGE (parent)-[r:CONTAINS]->(child)
         SET r.weight = coalesce(rel.weight, 1)
         """,
         parameters=("relationships",),
+        read_only=False,
     )
 
     BATCH_CREATE_CALLS = CypherQuery(
@@ -342,19 +427,43 @@ class QueryLibrary:
         MATCH (caller:Function {id: rel.caller_id})
         MATCH (callee:Function {id: rel.callee_id})
         MERGE (caller)-[r:CALLS]->(callee)
-        SET r.call_count = coalesce(r.call_count, 0) + rel.count
+        ON CREATE SET r.call_count = rel.count
+        ON MATCH SET r.call_count = r.call_count + rel.count
         """,
         parameters=("relationships",),
+        read_only=False,
     )
 
     @classmethod
-    def get_all_queries(cls) -> dict[str, CypherQuery]:
-        """Get all queries as a dictionary."""
-        return {
-            name: getattr(cls, name)
-            for name in dir(cls)
-            if isinstance(getattr(cls, name), CypherQuery)
-        }
+    def get_all_queries(cls) -> Mapping[str, CypherQuery]:
+        """Get all queries as a read-only name -> query mapping."""
+        return _ALL_QUERIES
+
+    @classmethod
+    def with_label(cls, query: CypherQuery, label: NodeLabel | str | None) -> str:
+        """
+        Get normalized query text, with the node looked up by id restricted
+        to a label.
+
+        A labelled match seeks the per-label id constraint instead of
+        scanning every node. Labels cannot be query parameters, so the
+        label is validated against NodeLabel and the expanded text cached.
+        The text is the same for every call with the same query and label,
+        so it doubles as a result cache key.
+
+        Args:
+            query: Query to expand
+            label: Label of the node with id $node_id, if known
+
+        Returns:
+            Cypher query text
+
+        Raises:
+            ValueError: If the label is not a NodeLabel
+        """
+        if label is None or query.label_variable is None:
+            return query.normalized
+        return _labelled_query(query, NodeLabel(label))
 
     @classmethod
     def validate_parameters(
@@ -363,3 +472,11 @@ class QueryLibrary:
         """Validate that all required parameters are provided."""
         missing = [p for p in query.parameters if p not in params]
         return missing
+
+
+# Query attributes are fixed once the class body has run; collected once here
+_ALL_QUERIES = MappingProxyType({
+    name: value
+    for name, value in sorted(vars(QueryLibrary).items())
+    if isinstance(value, CypherQuery)
+})
@@ -34,9 +34,11 @@ class RelationshipLabel(str, Enum):
     USES = "USES"
     RETURNS = "RETURNS"
     RAISES = "RAISES"
+    READS = "READS"
+    WRITES = "WRITES"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PropertyDefinition:
     """Definition of a node or relationship property."""
 
@@ -48,7 +50,7 @@ class PropertyDefinition:
     default: Any = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NodeDefinition:
     """Definition of a node type."""
 
@@ -57,7 +59,7 @@ class NodeDefinition:
     description: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RelationshipDefinition:
     """Definition of a relationship type."""
 
@@ -134,7 +136,7 @@ class GraphSchema:
                 PropertyDefinition("is_property", "boolean", default=False),
                 PropertyDefinition("parameters", "json"),  # List of parameter info
                 PropertyDefinition("return_type", "string"),
-                PropertyDefinition("complexity", "int", default=1),
+                PropertyDefinition("complexity", "int", default=1, indexed=True),
                 PropertyDefinition("line_number", "int"),
                 PropertyDefinition("docstring", "string"),
             ),
@@ -244,28 +246,7 @@ class GraphSchema:
         Returns:
             List of Cypher CREATE INDEX statements
         """
-        statements: list[str] = []
-
-        for node_def in cls.NODES.values():
-            for prop in node_def.properties:
-                if prop.unique:
-                    statements.append(
-                        f"CREATE CONSTRAINT {node_def.label.value.lower()}_{prop.name}_unique "
-                        f"IF NOT EXISTS FOR (n:{node_def.label.value}) REQUIRE n.{prop.name} IS UNIQUE"
-                    )
-                elif prop.indexed:
-                    statements.append(
-                        f"CREATE INDEX {node_def.label.value.lower()}_{prop.name}_idx "
-                        f"IF NOT EXISTS FOR (n:{node_def.label.value}) ON (n.{prop.name})"
-                    )
-
-        # Full-text search index for names
-        statements.append(
-            "CREATE FULLTEXT INDEX node_name_search IF NOT EXISTS "
-            "FOR (n:Package|Module|Class|Function|Variable) ON EACH [n.name, n.qualified_name]"
-        )
-
-        return statements
+        return list(_INDEX_DDL)
 
     @classmethod
     def get_constraint_creation_statements(cls) -> list[str]:
@@ -275,16 +256,7 @@ class GraphSchema:
         Returns:
             List of Cypher CREATE CONSTRAINT statements
         """
-        statements: list[str] = []
-
-        for node_def in cls.NODES.values():
-            # Require ID for all node types
-            statements.append(
-                f"CREATE CONSTRAINT {node_def.label.value.lower()}_id_exists "
-                f"IF NOT EXISTS FOR (n:{node_def.label.value}) REQUIRE n.id IS NOT NULL"
-            )
-
-        return statements
+        return list(_CONSTRAINT_DDL)
 
     @classmethod
     def validate_node(cls, label: NodeLabel, properties: dict[str, Any]) -> list[str]:
@@ -298,18 +270,15 @@ class GraphSchema:
         Returns:
             List of validation error messages (empty if valid)
         """
-        errors: list[str] = []
-        node_def = cls.NODES.get(label)
-
-        if not node_def:
-            errors.append(f"Unknown node label: {label}")
-            return errors
+        required = _REQUIRED_PROPERTIES.get(label)
+        if required is None:
+            return [f"Unknown node label: {label}"]
 
-        for prop_def in node_def.properties:
-            if prop_def.required and prop_def.name not in properties:
-                errors.append(f"Missing required property: {prop_def.name}")
-
-        return errors
+        names, name_set = required
+        # Common case: a single C-level subset check against the key view
+        if name_set <= properties.keys():
+            return []
+        return [f"Missing required property: {name}" for name in names if name not in properties]
 
     @classmethod
     def get_node_properties(cls, label: NodeLabel) -> list[str]:
@@ -318,3 +287,61 @@ class GraphSchema:
         if not node_def:
             return []
         return [p.name for p in node_def.properties]
+
+
+def _index_ddl() -> tuple[str, ...]:
+    """Build the index DDL from the node definitions."""
+    statements: list[str] = []
+
+    for node_def in GraphSchema.NODES.values():
+        label = node_def.label.value
+        prefix = label.lower()
+        for prop in node_def.properties:
+            if prop.unique:
+                statements.append(
+                    f"CREATE CONSTRAINT {prefix}_{prop.name}_unique "
+                    f"IF NOT EXISTS FOR (n:{label}) REQUIRE n.{prop.name} IS UNIQUE"
+                )
+            elif prop.indexed:
+                statements.append(
+                    f"CREATE INDEX {prefix}_{prop.name}_idx "
+                    f"IF NOT EXISTS FOR (n:{label}) ON (n.{prop.name})"
+                )
+
+    # Full-text search index for names
+    statements.append(
+        "CREATE FULLTEXT INDEX node_name_search IF NOT EXISTS "
+        "FOR (n:Package|Module|Class|Function|Variable) ON EACH [n.name, n.qualified_name]"
+    )
+
+    return tuple(statements)
+
+
+def _constraint_ddl() -> tuple[str, ...]:
+    """Build the constraint DDL from the node definitions."""
+    statements: list[str] = []
+
+    for node_def in GraphSchema.NODES.values():
+        # Require ID for all node types
+        statements.append(
+            f"CREATE CONSTRAINT {node_def.label.value.lower()}_id_exists "
+            f"IF NOT EXISTS FOR (n:{node_def.label.value}) REQUIRE n.id IS NOT NULL"
+        )
+
+    return tuple(statements)
+
+
+def _required_properties(node_def: NodeDefinition) -> tuple[tuple[str, ...], frozenset[str]]:
+    """Get a node type's required property names, in order and as a set."""
+    names = tuple(p.name for p in node_def.properties if p.required)
+    return names, frozenset(names)
+
+
+# Resolved once so validation does not walk every property definition
+_REQUIRED_PROPERTIES = {
+    label: _required_properties(node_def) for label, node_def in GraphSchema.NODES.items()
+}
+
+# Schema DDL never changes at runtime, so it is generated once
+_INDEX_DDL = _index_ddl()
+_CONSTRAINT_DDL = _constraint_ddl()
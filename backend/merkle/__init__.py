@@ -5,10 +5,11 @@ Efficient change detection using content-based hashing.
 Requires Python 3.11+.
 """
 
-from merkle.hash_calculator import HashCalculator
+from merkle.hash_calculator import HashCalculator, TreeIndex
 from merkle.change_detector import ChangeDetector
 
 __all__ = [
     "HashCalculator",
+    "TreeIndex",
     "ChangeDetector",
 ]
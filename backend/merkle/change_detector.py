@@ -5,15 +5,25 @@ Detects code changes using Merkle tree comparison.
 Requires Python 3.11+.
 """
 
+import hashlib
+from concurrent.futures import Executor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-from merkle.hash_calculator import HashCalculator
+from merkle.hash_calculator import HashCalculator, TreeIndex
 from parser.models import ModuleInfo
-from parser.tree_sitter_parser import TreeSitterParser
+from parser.tree_sitter_parser import get_parser
 from utils.logger import LoggerMixin
 
+# Batches smaller than this are parsed in-process; pool round-trips cost more
+_MIN_PARALLEL_FILES = 8
+
+
+def _parse_in_worker(path_str: str, content: bytes) -> ModuleInfo:
+    """Parse a single file's content inside a pool worker."""
+    return get_parser().parse_content(content, Path(path_str))
+
 
 @dataclass
 class ChangeSet:
@@ -43,6 +53,13 @@ class ChangeSet:
             affected_modules=self.affected_modules | other.affected_modules,
         )
 
+    def update(self, other: "ChangeSet") -> None:
+        """Merge another changeset into this one in place."""
+        self.added_nodes |= other.added_nodes
+        self.removed_nodes |= other.removed_nodes
+        self.modified_nodes |= other.modified_nodes
+        self.affected_modules |= other.affected_modules
+
 
 class ChangeDetector(LoggerMixin):
     """
@@ -54,48 +71,138 @@ class ChangeDetector(LoggerMixin):
 
     def __init__(self) -> None:
         """Initialize the change detector."""
-        self._parser = TreeSitterParser()
         self._hasher = HashCalculator()
         # Cache: path -> {qualified_name -> hash}
         self._hash_cache: dict[Path, dict[str, str]] = {}
         # Cache: path -> ModuleInfo
         self._module_cache: dict[Path, ModuleInfo] = {}
+        # Cache: path -> qualified-name index of the cached module's nodes
+        self._tree_index: dict[Path, TreeIndex] = {}
+        # Cache: path -> SHA-256 of the source the cached module was parsed from
+        self._source_digests: dict[Path, bytes] = {}
+        # Index: module qualified_name -> paths of the cached modules with that name
+        self._module_paths: dict[str, set[Path]] = {}
 
     def detect_changes(self, file_path: Path) -> ChangeSet:
         """
         Detect changes in a single file.
 
+        A file whose bytes match the source it was last parsed from is
+        reported unchanged without being parsed or hashed again.
+
         Args:
             file_path: Path to the changed file
 
         Returns:
             ChangeSet containing all detected changes
         """
-        changes = ChangeSet()
-
         if not file_path.exists():
-            # File was deleted
-            if file_path in self._hash_cache:
-                old_hashes = self._hash_cache.pop(file_path)
-                changes.removed_nodes = set(old_hashes.keys())
-                changes.affected_modules.add(str(file_path))
-                self._module_cache.pop(file_path, None)
-                self.log.info(
-                    "file_deleted",
-                    path=str(file_path),
-                    removed_count=len(changes.removed_nodes),
-                )
-            return changes
+            return self._forget_file(file_path)
 
         # Parse the file
         try:
-            new_module = self._parser.parse_file(file_path)
+            source = self._read_if_changed(file_path)
+            if source is None:
+                return ChangeSet()
+            content, digest = source
+            new_module = get_parser().parse_content(content, file_path)
         except Exception as e:
             self.log.error("parse_failed", path=str(file_path), error=str(e))
-            return changes
+            return ChangeSet()
+
+        self._source_digests[file_path] = digest
+        return self._update_module(file_path, new_module)
+
+    def detect_changes_batch(
+        self, file_paths: list[Path], executor: Executor | None = None
+    ) -> ChangeSet:
+        """
+        Detect changes in multiple files.
+
+        With an executor, files are parsed in parallel by its workers;
+        hashing and comparison stay in this process, since the cached
+        node index refers to the module objects held here.
+
+        Args:
+            file_paths: List of paths to check
+            executor: Optional process pool to parse files in
+
+        Returns:
+            Merged ChangeSet for all files
+        """
+        combined = ChangeSet()
+
+        if executor is None or len(file_paths) < _MIN_PARALLEL_FILES:
+            for path in file_paths:
+                file_changes = self.detect_changes(path)
+                combined.update(file_changes)
+            return combined
+
+        changed: list[tuple[Path, bytes, bytes]] = []
+        for path in file_paths:
+            if not path.exists():
+                combined.update(self._forget_file(path))
+                continue
+            try:
+                source = self._read_if_changed(path)
+            except OSError as e:
+                self.log.error("parse_failed", path=str(path), error=str(e))
+                continue
+            if source is not None:
+                changed.append((path, *source))
+
+        futures = [
+            executor.submit(_parse_in_worker, str(path), content)
+            for path, content, _ in changed
+        ]
+        for (path, _, digest), future in zip(changed, futures, strict=True):
+            try:
+                new_module = future.result()
+            except Exception as e:
+                self.log.error("parse_failed", path=str(path), error=str(e))
+                continue
+            self._source_digests[path] = digest
+            combined.update(self._update_module(path, new_module))
+
+        return combined
+
+    def _read_if_changed(self, file_path: Path) -> tuple[bytes, bytes] | None:
+        """
+        Read a file unless it matches the source of its cached module.
+
+        Args:
+            file_path: Path of an existing file
+
+        Returns:
+            Tuple of (content, digest), or None if the source is unchanged
+        """
+        content = file_path.read_bytes()
+        digest = hashlib.sha256(content).digest()
+        if file_path in self._hash_cache and self._source_digests.get(file_path) == digest:
+            return None
+        return content, digest
+
+    def _forget_file(self, file_path: Path) -> ChangeSet:
+        """Evict a deleted file and report all of its nodes as removed."""
+        changes = ChangeSet()
+        if file_path in self._hash_cache:
+            old_hashes = self._evict(file_path)
+            changes.removed_nodes = set(old_hashes.keys())
+            changes.affected_modules.add(str(file_path))
+            self.log.info(
+                "file_deleted",
+                path=str(file_path),
+                removed_count=len(changes.removed_nodes),
+            )
+        return changes
+
+    def _update_module(self, file_path: Path, new_module: ModuleInfo) -> ChangeSet:
+        """Hash a freshly parsed module, diff it against the cache and store it."""
+        changes = ChangeSet()
 
         # Calculate new hashes
-        new_hashes = self._hasher.hash_tree(new_module)
+        index = TreeIndex()
+        new_hashes = self._hasher.hash_tree(new_module, index)
 
         # Get old hashes if available
         old_hashes = self._hash_cache.get(file_path, {})
@@ -109,8 +216,7 @@ class ChangeDetector(LoggerMixin):
         changes.affected_modules.add(str(file_path))
 
         # Update cache
-        self._hash_cache[file_path] = new_hashes
-        self._module_cache[file_path] = new_module
+        self._store(file_path, new_module, new_hashes, index)
 
         if changes.has_changes:
             self.log.info(
@@ -123,23 +229,34 @@ class ChangeDetector(LoggerMixin):
 
         return changes
 
-    def detect_changes_batch(self, file_paths: list[Path]) -> ChangeSet:
-        """
-        Detect changes in multiple files.
-
-        Args:
-            file_paths: List of paths to check
-
-        Returns:
-            Merged ChangeSet for all files
-        """
-        combined = ChangeSet()
-
-        for path in file_paths:
-            file_changes = self.detect_changes(path)
-            combined = combined.merge(file_changes)
-
-        return combined
+    def _store(
+        self, file_path: Path, module: ModuleInfo, hashes: dict[str, str], index: TreeIndex
+    ) -> None:
+        """Cache a hashed module and index it by qualified name."""
+        old_module = self._module_cache.get(file_path)
+        if old_module is not None:
+            self._unindex_module(file_path, old_module)
+        self._hash_cache[file_path] = hashes
+        self._module_cache[file_path] = module
+        self._tree_index[file_path] = index
+        self._module_paths.setdefault(module.qualified_name, set()).add(file_path)
+
+    def _evict(self, file_path: Path) -> dict[str, str]:
+        """Drop a file from every cache and return its cached hashes."""
+        module = self._module_cache.pop(file_path, None)
+        if module is not None:
+            self._unindex_module(file_path, module)
+        self._tree_index.pop(file_path, None)
+        self._source_digests.pop(file_path, None)
+        return self._hash_cache.pop(file_path, {})
+
+    def _unindex_module(self, file_path: Path, module: ModuleInfo) -> None:
+        """Remove a cached module's entry from the qualified-name index."""
+        paths = self._module_paths.get(module.qualified_name)
+        if paths is not None:
+            paths.discard(file_path)
+            if not paths:
+                del self._module_paths[module.qualified_name]
 
     def initialize_from_modules(self, modules: list[ModuleInfo]) -> None:
         """
@@ -149,9 +266,11 @@ class ChangeDetector(LoggerMixin):
             modules: List of already-parsed ModuleInfo objects
         """
         for module in modules:
-            hashes = self._hasher.hash_tree(module)
-            self._hash_cache[module.path] = hashes
-            self._module_cache[module.path] = module
+            index = TreeIndex()
+            hashes = self._hasher.hash_tree(module, index)
+            self._store(module.path, module, hashes, index)
+            # The module's source is unknown, so the next change check reparses it
+            self._source_digests.pop(module.path, None)
 
         self.log.info(
             "cache_initialized",
@@ -178,6 +297,9 @@ class ChangeDetector(LoggerMixin):
         """Clear all cached data."""
         self._hash_cache.clear()
         self._module_cache.clear()
+        self._tree_index.clear()
+        self._source_digests.clear()
+        self._module_paths.clear()
         self.log.info("cache_cleared")
 
     def remove_file(self, file_path: Path) -> set[str]:
@@ -190,8 +312,7 @@ class ChangeDetector(LoggerMixin):
         Returns:
             Set of qualified names that were removed
         """
-        removed_hashes = self._hash_cache.pop(file_path, {})
-        self._module_cache.pop(file_path, None)
+        removed_hashes = self._evict(file_path)
         return set(removed_hashes.keys())
 
     def get_affected_by_change(
@@ -230,6 +351,8 @@ class ChangeDetector(LoggerMixin):
         Propagate hash changes up the tree.
 
         When a child node changes, parent hashes also need to be recalculated.
+        Only the changed nodes and their ancestors are rehashed; every other
+        node keeps its cached hash.
 
         Args:
             changes: The detected changes
@@ -239,23 +362,30 @@ class ChangeDetector(LoggerMixin):
         """
         updated_hashes: dict[str, str] = {}
         affected_paths: set[Path] = set()
-
-        # Find all affected paths
-        for file_path, hashes in self._hash_cache.items():
-            for name in changes.modified_nodes | changes.added_nodes | changes.removed_nodes:
-                if name in hashes or any(
-                    name.startswith(existing + ".") for existing in hashes
-                ):
-                    affected_paths.add(file_path)
+        changed_names = changes.modified_nodes | changes.added_nodes | changes.removed_nodes
+
+        # Every node's qualified name extends its module's, so the longest
+        # prefix naming a cached module locates the file
+        for name in changed_names:
+            prefix = name
+            while prefix:
+                paths = self._module_paths.get(prefix)
+                if paths:
+                    affected_paths.update(paths)
                     break
+                prefix = prefix.rpartition(".")[0]
 
-        # Recalculate hashes for affected modules
+        # Recalculate hashes along the changed paths of affected modules
         for path in affected_paths:
-            module = self._module_cache.get(path)
-            if module:
-                new_hashes = self._hasher.hash_tree(module)
-                self._hash_cache[path] = new_hashes
-                updated_hashes.update(new_hashes)
+            index = self._tree_index.get(path)
+            if index is None:
+                continue
+            hashes = self._hash_cache[path]
+            new_hashes = self._hasher.rehash_path(index, hashes, changed_names)
+            for name in changes.removed_nodes:
+                hashes.pop(name, None)
+            hashes.update(new_hashes)
+            updated_hashes.update(new_hashes)
 
         return updated_hashes
 
@@ -7,6 +7,7 @@ Requires Python 3.11+.
 
 import hashlib
 import json
+from dataclasses import dataclass, field
 from typing import Any
 
 from parser.models import (
@@ -19,6 +20,22 @@ from parser.models import (
 from utils.logger import LoggerMixin
 
 
+@dataclass(slots=True)
+class TreeIndex:
+    """Qualified-name lookups for the nodes of one hashed module tree."""
+
+    nodes: dict[str, Any] = field(default_factory=dict)
+    parents: dict[str, str] = field(default_factory=dict)
+    children: dict[str, list[str]] = field(default_factory=dict)
+
+    def add(self, qualified_name: str, node: Any, parent: str | None) -> None:
+        """Record a node and link it to its parent."""
+        self.nodes[qualified_name] = node
+        if parent is not None:
+            self.parents[qualified_name] = parent
+            self.children.setdefault(parent, []).append(qualified_name)
+
+
 class HashCalculator(LoggerMixin):
     """
     Calculates content-based hashes for code elements.
@@ -37,7 +54,7 @@ class HashCalculator(LoggerMixin):
         """
         self._include_docstrings = include_docstrings
 
-    def hash_module(self, module: ModuleInfo) -> str:
+    def hash_module(self, module: ModuleInfo, memo: dict[int, str] | None = None) -> str:
         """
         Calculate hash for a module.
 
@@ -50,10 +67,14 @@ class HashCalculator(LoggerMixin):
 
         Args:
             module: ModuleInfo to hash
+            memo: Hashes already computed in this pass, keyed by id()
 
         Returns:
             SHA-256 hash as hex string
         """
+        if memo is not None and id(module) in memo:
+            return memo[id(module)]
+
         components: list[str] = [
             str(module.path),
         ]
@@ -62,24 +83,24 @@ class HashCalculator(LoggerMixin):
             components.append(module.docstring)
 
         # Add sorted import hashes
-        import_hashes = sorted(self.hash_import(imp) for imp in module.imports)
+        import_hashes = sorted(self.hash_import(imp, memo) for imp in module.imports)
         components.extend(import_hashes)
 
         # Add sorted class hashes
-        class_hashes = sorted(self.hash_class(cls) for cls in module.classes)
+        class_hashes = sorted(self.hash_class(cls, memo) for cls in module.classes)
         components.extend(class_hashes)
 
         # Add sorted function hashes
-        function_hashes = sorted(self.hash_function(func) for func in module.functions)
+        function_hashes = sorted(self.hash_function(func, memo) for func in module.functions)
         components.extend(function_hashes)
 
         # Add sorted variable hashes
-        variable_hashes = sorted(self.hash_variable(var) for var in module.variables)
+        variable_hashes = sorted(self.hash_variable(var, memo) for var in module.variables)
         components.extend(variable_hashes)
 
-        return self._compute_hash(components)
+        return self._remember(memo, module, self._compute_hash(components))
 
-    def hash_class(self, cls: ClassInfo) -> str:
+    def hash_class(self, cls: ClassInfo, memo: dict[int, str] | None = None) -> str:
         """
         Calculate hash for a class.
 
@@ -93,10 +114,14 @@ class HashCalculator(LoggerMixin):
 
         Args:
             cls: ClassInfo to hash
+            memo: Hashes already computed in this pass, keyed by id()
 
         Returns:
             SHA-256 hash as hex string
         """
+        if memo is not None and id(cls) in memo:
+            return memo[id(cls)]
+
         components: list[str] = [
             cls.name,
         ]
@@ -112,28 +137,28 @@ class HashCalculator(LoggerMixin):
             components.append(cls.docstring)
 
         # Add sorted method hashes
-        method_hashes = sorted(self.hash_function(method) for method in cls.methods)
+        method_hashes = sorted(self.hash_function(method, memo) for method in cls.methods)
         components.extend(method_hashes)
 
         # Add sorted class variable hashes
         class_var_hashes = sorted(
-            self.hash_variable(var) for var in cls.class_variables
+            self.hash_variable(var, memo) for var in cls.class_variables
         )
         components.extend(class_var_hashes)
 
         # Add sorted instance variable hashes
         instance_var_hashes = sorted(
-            self.hash_variable(var) for var in cls.instance_variables
+            self.hash_variable(var, memo) for var in cls.instance_variables
         )
         components.extend(instance_var_hashes)
 
         # Add nested class hashes
-        nested_hashes = sorted(self.hash_class(nested) for nested in cls.nested_classes)
+        nested_hashes = sorted(self.hash_class(nested, memo) for nested in cls.nested_classes)
         components.extend(nested_hashes)
 
-        return self._compute_hash(components)
+        return self._remember(memo, cls, self._compute_hash(components))
 
-    def hash_function(self, func: FunctionInfo) -> str:
+    def hash_function(self, func: FunctionInfo, memo: dict[int, str] | None = None) -> str:
         """
         Calculate hash for a function.
 
@@ -148,10 +173,14 @@ class HashCalculator(LoggerMixin):
 
         Args:
             func: FunctionInfo to hash
+            memo: Hashes already computed in this pass, keyed by id()
 
         Returns:
             SHA-256 hash as hex string
         """
+        if memo is not None and id(func) in memo:
+            return memo[id(func)]
+
         components: list[str] = [
             func.name,
         ]
@@ -190,16 +219,16 @@ class HashCalculator(LoggerMixin):
         components.extend(sorted(func.calls))
 
         # Add sorted local variable hashes
-        var_hashes = sorted(self.hash_variable(var) for var in func.variables)
+        var_hashes = sorted(self.hash_variable(var, memo) for var in func.variables)
         components.extend(var_hashes)
 
         # Add body hash if available
         if func.body_hash:
             components.append(func.body_hash)
 
-        return self._compute_hash(components)
+        return self._remember(memo, func, self._compute_hash(components))
 
-    def hash_variable(self, var: VariableInfo) -> str:
+    def hash_variable(self, var: VariableInfo, memo: dict[int, str] | None = None) -> str:
         """
         Calculate hash for a variable.
 
@@ -210,10 +239,14 @@ class HashCalculator(LoggerMixin):
 
         Args:
             var: VariableInfo to hash
+            memo: Hashes already computed in this pass, keyed by id()
 
         Returns:
             SHA-256 hash as hex string
         """
+        if memo is not None and id(var) in memo:
+            return memo[id(var)]
+
         components: list[str] = [var.name]
 
         if var.type_hint:
@@ -222,9 +255,9 @@ class HashCalculator(LoggerMixin):
         if var.initial_value:
             components.append(var.initial_value)
 
-        return self._compute_hash(components)
+        return self._remember(memo, var, self._compute_hash(components))
 
-    def hash_import(self, imp: ImportInfo) -> str:
+    def hash_import(self, imp: ImportInfo, memo: dict[int, str] | None = None) -> str:
         """
         Calculate hash for an import statement.
 
@@ -235,10 +268,14 @@ class HashCalculator(LoggerMixin):
 
         Args:
             imp: ImportInfo to hash
+            memo: Hashes already computed in this pass, keyed by id()
 
         Returns:
             SHA-256 hash as hex string
         """
+        if memo is not None and id(imp) in memo:
+            return memo[id(imp)]
+
         components: list[str] = [imp.module_name]
 
         if imp.is_relative:
@@ -250,7 +287,14 @@ class HashCalculator(LoggerMixin):
         for name, alias in sorted(imp.aliases.items()):
             components.append(f"{name}={alias}")
 
-        return self._compute_hash(components)
+        return self._remember(memo, imp, self._compute_hash(components))
+
+    @staticmethod
+    def _remember(memo: dict[int, str] | None, node: Any, node_hash: str) -> str:
+        """Record a node's hash in the memo, if one is in use."""
+        if memo is not None:
+            memo[id(node)] = node_hash
+        return node_hash
 
     def _compute_hash(self, components: list[str]) -> str:
         """
@@ -262,11 +306,13 @@ class HashCalculator(LoggerMixin):
         Returns:
             SHA-256 hash as hex string
         """
-        # Join with null separator to avoid collisions
-        content = "\x00".join(str(c) for c in components if c)
+        # Join with null separator to avoid collisions. Components are short
+        # (names, signatures, child digests), so one join and one update beat
+        # streaming each component into the hash object
+        content = "\x00".join(filter(None, components))
         return hashlib.sha256(content.encode("utf-8")).hexdigest()
 
-    def hash_tree(self, module: ModuleInfo) -> dict[str, str]:
+    def hash_tree(self, module: ModuleInfo, index: TreeIndex | None = None) -> dict[str, str]:
         """
         Calculate hashes for entire module tree.
 
@@ -275,64 +321,150 @@ class HashCalculator(LoggerMixin):
 
         Args:
             module: ModuleInfo to hash
+            index: Optional index to fill with every hashed node and its parent
 
         Returns:
             Dictionary of qualified_name -> hash
         """
         hashes: dict[str, str] = {}
+        # Each node is hashed once; parents reuse their children's hashes
+        memo: dict[int, str] = {}
+        module_name = module.qualified_name
 
         # Hash all classes and their contents
         for cls in module.classes:
-            self._hash_class_recursive(cls, hashes)
+            self._hash_class_recursive(cls, hashes, memo, index, module_name)
 
         # Hash all top-level functions
         for func in module.functions:
-            func_hash = self.hash_function(func)
+            func_hash = self.hash_function(func, memo)
             hashes[func.qualified_name] = func_hash
+            if index is not None:
+                index.add(func.qualified_name, func, module_name)
 
         # Hash all top-level variables
         for var in module.variables:
-            var_hash = self.hash_variable(var)
-            qualified_name = f"{module.qualified_name}.{var.name}"
+            var_hash = self.hash_variable(var, memo)
+            qualified_name = f"{module_name}.{var.name}"
             hashes[qualified_name] = var_hash
+            if index is not None:
+                index.add(qualified_name, var, module_name)
 
         # Hash imports
         for i, imp in enumerate(module.imports):
-            imp_hash = self.hash_import(imp)
-            hashes[f"{module.qualified_name}.__import_{i}__"] = imp_hash
+            imp_hash = self.hash_import(imp, memo)
+            qualified_name = f"{module_name}.__import_{i}__"
+            hashes[qualified_name] = imp_hash
+            if index is not None:
+                index.add(qualified_name, imp, module_name)
 
         # Hash the module itself (depends on all children)
-        module_hash = self.hash_module(module)
-        hashes[module.qualified_name] = module_hash
+        module_hash = self.hash_module(module, memo)
+        hashes[module_name] = module_hash
         module.hash = module_hash
+        if index is not None:
+            index.add(module_name, module, None)
 
         return hashes
 
     def _hash_class_recursive(
-        self, cls: ClassInfo, hashes: dict[str, str]
+        self,
+        cls: ClassInfo,
+        hashes: dict[str, str],
+        memo: dict[int, str],
+        index: TreeIndex | None = None,
+        parent: str | None = None,
     ) -> str:
         """Recursively hash a class and all its contents."""
+        class_name = cls.qualified_name
+
         # Hash all methods
         for method in cls.methods:
-            method_hash = self.hash_function(method)
+            method_hash = self.hash_function(method, memo)
             hashes[method.qualified_name] = method_hash
+            if index is not None:
+                index.add(method.qualified_name, method, class_name)
 
         # Hash all class variables
         for var in cls.all_variables:
-            var_hash = self.hash_variable(var)
-            qualified_name = f"{cls.qualified_name}.{var.name}"
+            var_hash = self.hash_variable(var, memo)
+            qualified_name = f"{class_name}.{var.name}"
             hashes[qualified_name] = var_hash
+            if index is not None:
+                index.add(qualified_name, var, class_name)
 
         # Hash nested classes
         for nested in cls.nested_classes:
-            self._hash_class_recursive(nested, hashes)
+            self._hash_class_recursive(nested, hashes, memo, index, class_name)
 
         # Hash the class itself
-        class_hash = self.hash_class(cls)
-        hashes[cls.qualified_name] = class_hash
+        class_hash = self.hash_class(cls, memo)
+        hashes[class_name] = class_hash
+        if index is not None:
+            index.add(class_name, cls, parent)
 
         return class_hash
 
+    def rehash_path(
+        self, index: TreeIndex, hashes: dict[str, str], names: set[str]
+    ) -> dict[str, str]:
+        """
+        Recalculate hashes for changed nodes and their ancestors only.
+
+        Every other node keeps its hash from the previous pass, so a single
+        changed function costs one hash per level up to the module rather
+        than a hash of the whole tree.
+
+        Args:
+            index: Index filled by hash_tree for the module's current nodes
+            hashes: Hashes from the previous pass, keyed by qualified name
+            names: Qualified names of nodes that changed
+
+        Returns:
+            Dictionary of qualified_name -> hash for the recalculated nodes
+        """
+        dirty: set[str] = set()
+        for name in names:
+            # Removed nodes are gone from the tree; start from their nearest survivor
+            current: str | None = name
+            while current and current not in index.nodes:
+                current = current.rpartition(".")[0]
+            while current and current not in dirty:
+                dirty.add(current)
+                current = index.parents.get(current)
+
+        # Seed the memo with the unchanged children of every dirty node
+        memo: dict[int, str] = {}
+        for name in dirty:
+            for child in index.children.get(name, ()):
+                if child not in dirty and child in hashes:
+                    memo[id(index.nodes[child])] = hashes[child]
+
+        # Deepest nodes first so each parent sees its children's new hashes;
+        # a child's qualified name always extends its parent's
+        updated: dict[str, str] = {}
+        for name in sorted(dirty, key=lambda n: n.count("."), reverse=True):
+            updated[name] = self._hash_node(index.nodes[name], memo)
+
+        return updated
+
+    def _hash_node(self, node: Any, memo: dict[int, str]) -> str:
+        """Hash a node of any type, reusing hashes already in the memo."""
+        match node:
+            case ModuleInfo():
+                node_hash = self.hash_module(node, memo)
+                node.hash = node_hash
+                return node_hash
+            case ClassInfo():
+                return self.hash_class(node, memo)
+            case FunctionInfo():
+                return self.hash_function(node, memo)
+            case VariableInfo():
+                return self.hash_variable(node, memo)
+            case ImportInfo():
+                return self.hash_import(node, memo)
+        raise TypeError(f"Cannot hash node of type {type(node).__name__}")
+
     def compare_hashes(
         self, old_hashes: dict[str, str], new_hashes: dict[str, str]
     ) -> tuple[set[str], set[str], set[str]]:
@@ -346,16 +478,11 @@ class HashCalculator(LoggerMixin):
         Returns:
             Tuple of (added, removed, modified) qualified names
         """
-        old_keys = set(old_hashes.keys())
-        new_keys = set(new_hashes.keys())
-
-        added = new_keys - old_keys
-        removed = old_keys - new_keys
-        common = old_keys & new_keys
+        # Set operations on the dict views run in C without copying the keys
+        added = new_hashes.keys() - old_hashes.keys()
+        removed = old_hashes.keys() - new_hashes.keys()
 
-        modified = {
-            key for key in common
-            if old_hashes[key] != new_hashes[key]
-        }
+        # (name, hash) pairs only in the new tree are either added or modified
+        modified = {key for key, _ in new_hashes.items() - old_hashes.items()} - added
 
         return added, removed, modified
@@ -5,6 +5,9 @@ Tree-sitter based Python code parser for the visualization system.
 Requires Python 3.11+.
 """
 
+import importlib
+from typing import Any
+
 from parser.models import (
     NodeType,
     RelationshipType,
@@ -19,9 +22,6 @@ from parser.models import (
     ModuleInfo,
     Relationship,
 )
-from parser.tree_sitter_parser import TreeSitterParser
-from parser.ast_analyzer import ASTAnalyzer
-from parser.relationship_extractor import RelationshipExtractor
 
 __all__ = [
     # Enums
@@ -43,3 +43,20 @@ __all__ = [
     "ASTAnalyzer",
     "RelationshipExtractor",
 ]
+
+
+# Parser classes load tree-sitter, so import them on first access only
+_LAZY_IMPORTS = {
+    "TreeSitterParser": "parser.tree_sitter_parser",
+    "ASTAnalyzer": "parser.ast_analyzer",
+    "RelationshipExtractor": "parser.relationship_extractor",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
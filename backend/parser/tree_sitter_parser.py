@@ -5,6 +5,7 @@ Fast, incremental parsing of Python source files using Tree-sitter.
 Requires Python 3.11+.
 """
 
+import threading
 import time
 from pathlib import Path
 from typing import Iterator
@@ -24,6 +25,9 @@ from parser.models import (
 )
 from utils.logger import LoggerMixin
 
+# Per-thread parsers; a parser holds the source and tree of its current parse
+_thread_state = threading.local()
+
 
 class TreeSitterParser(LoggerMixin):
     """
@@ -624,3 +628,20 @@ class TreeSitterParser(LoggerMixin):
             return False
 
         return walk(block)
+
+
+def get_parser() -> TreeSitterParser:
+    """
+    Get the calling thread's parser, creating it on first use.
+
+    Loading the grammar is paid once per thread (and so once per pool
+    worker process) instead of once per caller.
+
+    Returns:
+        TreeSitterParser owned by the current thread
+    """
+    parser: TreeSitterParser | None = getattr(_thread_state, "parser", None)
+    if parser is None:
+        parser = TreeSitterParser()
+        _thread_state.parser = parser
+    return parser
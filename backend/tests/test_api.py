@@ -4,9 +4,13 @@ Tests for API Routes.
 Requires Python 3.11+.
 """
 
+import asyncio
+import json
+
 import pytest
 from fastapi.testclient import TestClient
 
+from api.dependencies import require_neo4j_client
 from api.main import app
 
 
@@ -16,6 +20,45 @@ def client():
     return TestClient(app)
 
 
+class FakeStreamingClient:
+    """Neo4j client stand-in that streams fixed rows for one node."""
+
+    node_id = "mod-id"
+    children = [
+        {"id": "pkg/mod.py::Foo", "name": "Foo", "type": "class", "child_count": 2},
+        {"id": "pkg/mod.py::bar", "name": "bar", "type": "function", "is_async": True},
+    ]
+    references = [
+        {
+            "id": "pkg/other.py::baz",
+            "name": "baz",
+            "type": "function",
+            "rel_type": "CALLS",
+            "direction": "incoming",
+        },
+    ]
+
+    async def get_node_children_stream(self, node_id, limit=1000):
+        assert node_id == self.node_id
+        for row in self.children[:limit]:
+            yield row
+
+    async def get_node_references_stream(self, node_id):
+        assert node_id == self.node_id
+        for row in self.references:
+            yield row
+
+
+@pytest.fixture
+def streaming_client():
+    """Create a test client backed by FakeStreamingClient."""
+    app.dependency_overrides[require_neo4j_client] = FakeStreamingClient
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.pop(require_neo4j_client, None)
+
+
 class TestHealthEndpoint:
     """Test cases for health endpoint."""
 
@@ -43,6 +86,47 @@ class TestGraphEndpoints:
         response = client.get("/graph/node/nonexistent-id")
         assert response.status_code in [404, 503]
 
+    def test_stream_children(self, streaming_client):
+        """Test NDJSON children endpoint emits one node per line."""
+        response = streaming_client.get("/graph/node/mod-id/children.ndjson")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+
+        lines = response.text.splitlines()
+        assert response.text.endswith("\n")
+        assert len(lines) == 2
+
+        records = [json.loads(line) for line in lines]
+        assert [r["id"] for r in records] == ["pkg/mod.py::Foo", "pkg/mod.py::bar"]
+        assert records[0]["child_count"] == 2
+        assert records[1]["is_async"] is True
+        assert records[1]["child_count"] == 0
+
+    def test_stream_references(self, streaming_client):
+        """Test NDJSON references endpoint emits one reference per line."""
+        response = streaming_client.get("/graph/node/mod-id/references.ndjson")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+
+        records = [json.loads(line) for line in response.text.splitlines()]
+        assert records == [
+            {
+                "id": "pkg/other.py::baz",
+                "name": "baz",
+                "type": "function",
+                "qualified_name": None,
+                "relationship_type": "CALLS",
+                "direction": "incoming",
+                "line_number": None,
+            },
+        ]
+
+    def test_parse_invalid_body(self, client):
+        """Test parse request body is validated from raw JSON."""
+        response = client.post("/graph/parse", json={"recursive": True})
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"] == ["body", "path"]
+
 
 class TestSearchEndpoints:
     """Test cases for search endpoints."""
@@ -58,3 +142,99 @@ class TestSearchEndpoints:
         response = client.get("/search?q=test")
         # May return 503 if no database
         assert response.status_code in [200, 503]
+
+
+class TestWebSocket:
+    """Test cases for the WebSocket endpoint."""
+
+    def test_ping_pong(self, client):
+        """Test messages arrive as binary JSON frames."""
+        with client.websocket_connect("/ws") as websocket:
+            assert websocket.receive_json(mode="binary")["type"] == "connected"
+            websocket.send_json({"type": "ping"})
+            assert websocket.receive_json(mode="binary") == {"type": "pong"}
+
+    def test_oversized_message(self, client):
+        """Test oversized client messages are rejected before parsing."""
+        with client.websocket_connect("/ws") as websocket:
+            websocket.receive_json(mode="binary")
+            websocket.send_text("x" * (64 * 1024 + 1))
+            assert websocket.receive_json(mode="binary")["message"] == "Message too large"
+
+
+class FakeWebSocket:
+    """WebSocket stand-in that records raw ASGI send messages."""
+
+    def __init__(self, fail: bool = False, stall: bool = False) -> None:
+        self.fail = fail
+        self.stall = stall
+        self.sent: list[dict] = []
+        self.close_code: int | None = None
+
+    async def accept(self) -> None:
+        pass
+
+    async def send(self, message: dict) -> None:
+        if self.fail:
+            raise ConnectionError("client went away")
+        if self.stall:
+            await asyncio.Event().wait()
+        self.sent.append(message)
+
+    async def close(self, code: int = 1000) -> None:
+        self.close_code = code
+
+
+class TestWebSocketManager:
+    """Test cases for WebSocket broadcasting."""
+
+    async def test_broadcast_reaches_every_client(self):
+        """Test a broadcast larger than one batch reaches all clients."""
+        from api.routes.websocket import BROADCAST_BATCH_SIZE, WebSocketManager
+
+        manager = WebSocketManager()
+        sockets = [FakeWebSocket() for _ in range(BROADCAST_BATCH_SIZE * 2 + 1)]
+        for socket in sockets:
+            await manager.connect(socket)
+
+        await manager.broadcast({"type": "graph_updated"})
+
+        payload = json.dumps({"type": "graph_updated"}, separators=(",", ":")).encode()
+        for socket in sockets:
+            assert socket.sent == [{"type": "websocket.send", "bytes": payload}]
+        assert manager.connection_count == len(sockets)
+
+    async def test_broadcast_evicts_failed_clients(self):
+        """Test clients whose send fails are dropped while others still receive."""
+        from api.routes.websocket import WebSocketManager
+
+        manager = WebSocketManager()
+        healthy = FakeWebSocket()
+        broken = FakeWebSocket(fail=True)
+        await manager.connect(healthy)
+        await manager.connect(broken)
+
+        await manager.broadcast_raw(b"{}")
+        await manager.broadcast_raw(b"[]")
+
+        assert manager.connection_count == 1
+        assert [m["bytes"] for m in healthy.sent] == [b"{}", b"[]"]
+
+    async def test_broadcast_closes_stalled_clients(self, monkeypatch):
+        """Test a client that times out is evicted and closed so it reconnects."""
+        from api.routes import websocket
+        from api.routes.websocket import WebSocketManager
+
+        monkeypatch.setattr(websocket, "SEND_TIMEOUT", 0.01)
+        manager = WebSocketManager()
+        healthy = FakeWebSocket()
+        stalled = FakeWebSocket(stall=True)
+        await manager.connect(healthy)
+        await manager.connect(stalled)
+
+        await manager.broadcast_raw(b"{}")
+
+        assert manager.connection_count == 1
+        assert stalled.close_code == 1011
+        assert healthy.close_code is None
+        assert [m["bytes"] for m in healthy.sent] == [b"{}"]
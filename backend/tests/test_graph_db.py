@@ -0,0 +1,142 @@
+"""
+Tests for the Neo4j client read cache.
+
+Requires Python 3.11+.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from typing import Any
+
+import pytest
+
+from graph_db.neo4j_client import Neo4jClient
+from graph_db.queries import CypherQuery, QueryLibrary
+
+
+class FakeSession:
+    """Session stand-in whose writes wait until released."""
+
+    def __init__(self) -> None:
+        self.release = asyncio.Event()
+        self.release.set()
+        self.writes = 0
+
+    async def execute_write(self, _work: Callable[..., Awaitable[Any]], *_args: Any) -> Any:
+        await self.release.wait()
+        self.writes += 1
+        return {}
+
+
+class CachingHarness:
+    """Neo4jClient whose reads are counted and whose writes are faked."""
+
+    def __init__(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        self.client = Neo4jClient()
+        self.session = FakeSession()
+        self.reads = 0
+        self.queries: list[str] = []
+        self.read_gate = asyncio.Event()
+        self.read_gate.set()
+
+        @asynccontextmanager
+        async def session(_access_mode: str | None = None) -> AsyncIterator[FakeSession]:
+            yield self.session
+
+        monkeypatch.setattr(self.client, "execute_read", self.execute_read)
+        monkeypatch.setattr(self.client, "session", session)
+
+    async def execute_read(
+        self, query: str, _parameters: dict[str, Any] | None = None
+    ) -> list[dict[str, Any]]:
+        self.reads += 1
+        self.queries.append(query)
+        await self.read_gate.wait()
+        return [{"id": f"root-{self.reads}"}]
+
+    async def write(self) -> None:
+        await self.client.execute_write("CREATE (:Module {id: 'm'})")
+
+
+class TestReadCache:
+    """Test cases for Neo4jClient read caching and invalidation."""
+
+    @pytest.fixture
+    def harness(self, monkeypatch: pytest.MonkeyPatch) -> CachingHarness:
+        """Create a client with counted reads and faked writes."""
+        return CachingHarness(monkeypatch)
+
+    async def test_repeated_read_is_cached(self, harness: CachingHarness) -> None:
+        """Test identical reads hit Neo4j once."""
+        first = await harness.client.get_root_nodes()
+        second = await harness.client.get_root_nodes()
+
+        assert harness.reads == 1
+        assert first == second
+
+    async def test_write_invalidates_cache(self, harness: CachingHarness) -> None:
+        """Test a committed write forces the next read back to Neo4j."""
+        await harness.client.get_root_nodes()
+        await harness.write()
+        result = await harness.client.get_root_nodes()
+
+        assert harness.reads == 2
+        assert result == [{"id": "root-2"}]
+
+    async def test_read_during_write_is_not_cached(self, harness: CachingHarness) -> None:
+        """Test a read that completes while a write is in flight is not stored."""
+        harness.session.release.clear()
+        write = asyncio.create_task(harness.write())
+        await asyncio.sleep(0)
+
+        await harness.client.get_root_nodes()
+        harness.session.release.set()
+        await write
+        await harness.client.get_root_nodes()
+
+        assert harness.session.writes == 1
+        assert harness.reads == 2
+
+    async def test_read_spanning_write_is_not_cached(self, harness: CachingHarness) -> None:
+        """Test a read that started before a write cannot fill the cache after it."""
+        harness.read_gate.clear()
+        read = asyncio.create_task(harness.client.get_root_nodes())
+        await asyncio.sleep(0)
+
+        await harness.write()
+        harness.read_gate.set()
+        await read
+        await harness.client.get_root_nodes()
+
+        assert harness.reads == 2
+
+    async def test_run_query_keys_on_normalized_text(self, harness: CachingHarness) -> None:
+        """Test run_query sends normalized text and shares results across layouts."""
+        compact = CypherQuery("ROOTS", "Root ids", "MATCH (n:Package) RETURN n.id AS id", ())
+        spread = CypherQuery(
+            "ROOTS", "Root ids", "MATCH (n:Package)\n        RETURN n.id AS id\n", ()
+        )
+
+        first = await harness.client.run_query(compact)
+        second = await harness.client.run_query(spread)
+
+        assert harness.queries == ["MATCH (n:Package) RETURN n.id AS id"]
+        assert first == second
+
+    async def test_ancestors_run_through_query_library(self, harness: CachingHarness) -> None:
+        """Test breadcrumbs use the library query and are served from the cache."""
+        await harness.client.get_node_ancestors("pkg.mod")
+        await harness.client.get_node_ancestors("pkg.mod")
+
+        assert harness.queries == [QueryLibrary.GET_ANCESTORS.normalized]
+
+    async def test_run_query_write_invalidates_cache(self, harness: CachingHarness) -> None:
+        """Test a run_query write drops results cached by run_query reads."""
+        await harness.client.get_node_ancestors("pkg.mod")
+        await harness.client.run_query(
+            QueryLibrary.UPDATE_NODE_HASH, {"node_id": "pkg.mod", "hash": "abc"}
+        )
+        await harness.client.get_node_ancestors("pkg.mod")
+
+        assert harness.reads == 2
@@ -9,7 +9,7 @@ from pathlib import Path
 import pytest
 
 from parser.tree_sitter_parser import TreeSitterParser
-from merkle.hash_calculator import HashCalculator
+from merkle.hash_calculator import HashCalculator, TreeIndex
 
 
 class TestHashCalculator:
@@ -81,6 +81,22 @@ class TestHashCalculator:
         assert "test.DerivedClass" in tree_hashes
         assert "test.standalone_function" in tree_hashes
 
+    def test_rehash_path(self, hasher: HashCalculator, parser: TreeSitterParser, sample_python_code: str):
+        """Test that rehashing a changed path matches a full tree hash."""
+        module = parser.parse_content(sample_python_code.encode(), Path("test.py"))
+        old_hashes = hasher.hash_tree(module)
+
+        cls = next(c for c in module.classes if c.name == "DerivedClass")
+        method = next(m for m in cls.methods if m.name == "async_method")
+        method.docstring = "Changed docstring."
+
+        index = TreeIndex()
+        full_hashes = hasher.hash_tree(module, index)
+        updated = hasher.rehash_path(index, old_hashes, {method.qualified_name})
+
+        assert set(updated) == {"test", "test.DerivedClass", method.qualified_name}
+        assert {**old_hashes, **updated} == full_hashes
+
     def test_compare_hashes(self, hasher: HashCalculator):
         """Test hash comparison."""
         old_hashes = {
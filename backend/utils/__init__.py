@@ -5,14 +5,17 @@ Common utilities shared across all backend modules.
 Requires Python 3.11+.
 """
 
+from utils.cache import TTLCache
 from utils.config import Settings, get_settings
-from utils.logger import configure_logging, get_logger, logger, LoggerMixin
+from utils.logger import configure_logging, get_logger, is_debug_enabled, logger, LoggerMixin
 
 __all__ = [
     "Settings",
     "get_settings",
     "configure_logging",
     "get_logger",
+    "is_debug_enabled",
     "logger",
     "LoggerMixin",
+    "TTLCache",
 ]
@@ -34,6 +34,17 @@ class Neo4jSettings(BaseSettings):
     database: str = Field(default="neo4j", description="Neo4j database name")
     max_connection_pool_size: int = Field(default=50, ge=1, le=100)
     connection_timeout: float = Field(default=30.0, ge=1.0)
+    connection_acquisition_timeout: float = Field(
+        default=60.0, ge=1.0, description="Max wait for a pooled connection"
+    )
+    max_connection_lifetime: float = Field(
+        default=3600.0, ge=1.0, description="Seconds before a connection is recycled"
+    )
+    keep_alive: bool = Field(default=True, description="Enable TCP keep-alive")
+    fetch_size: int = Field(default=1000, ge=1, description="Records fetched per round-trip")
+    max_transaction_retry_time: float = Field(
+        default=15.0, ge=0.0, description="Max seconds spent retrying a transaction"
+    )
 
 
 class ParserSettings(BaseSettings):
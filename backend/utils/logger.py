@@ -110,6 +110,19 @@ def get_logger(name: str | None = None) -> structlog.stdlib.BoundLogger:
     return structlog.get_logger(name)
 
 
+def is_debug_enabled() -> bool:
+    """
+    Check whether debug-level log entries are emitted.
+
+    Hot paths can resolve this once at import and skip building debug
+    log calls entirely when the configured level is higher.
+
+    Returns:
+        True if the configured log level is DEBUG
+    """
+    return get_settings().logging.level.upper() == "DEBUG"
+
+
 # Pre-configured logger for quick imports
 logger = get_logger("neurocode")
 
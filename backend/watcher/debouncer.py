@@ -7,6 +7,7 @@ Requires Python 3.11+.
 
 import asyncio
 import threading
+import time
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -71,8 +72,6 @@ class Debouncer(LoggerMixin):
             path: Path to the changed file
             change_type: Type of change (created, modified, deleted)
         """
-        import time
-
         with self._lock:
             # Cancel existing timer
             if self._timer is not None:
@@ -214,8 +213,6 @@ class AsyncDebouncer:
             path: Path to the changed file
             change_type: Type of change
         """
-        import time
-
         async with self._lock:
             # Cancel existing task
             if self._task is not None and not self._task.done():
@@ -34,6 +34,8 @@ interface WebSocketMessage {
     };
 }
 
+const textDecoder = new TextDecoder();
+
 export function useWebSocket(options: UseWebSocketOptions = {}) {
     const {
         url = 'ws://localhost:8000/ws',
@@ -62,6 +64,8 @@ export function useWebSocket(options: UseWebSocketOptions = {}) {
 
         try {
             const ws = new WebSocket(url);
+            // Server messages arrive as binary frames of UTF-8 JSON
+            ws.binaryType = 'arraybuffer';
 
             ws.onopen = () => {
                 setState((prev) => ({ ...prev, isConnected: true, error: null }));
@@ -71,13 +75,17 @@ export function useWebSocket(options: UseWebSocketOptions = {}) {
 
             ws.onmessage = (event) => {
                 try {
-                    const data: WebSocketMessage = JSON.parse(event.data);
+                    const text = typeof event.data === 'string'
+                        ? event.data
+                        : textDecoder.decode(event.data);
+                    const data: WebSocketMessage = JSON.parse(text);
                     setState((prev) => ({ ...prev, lastMessage: data }));
 
                     // Handle specific message types
                     switch (data.type) {
                         case 'graph_updated':
                         case 'file_changed':
+                        case 'file_changed_batch':
                             console.log('[WebSocket] Graph update received:', data);
                             reset();
                             loadRootNodes();
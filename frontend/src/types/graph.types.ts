@@ -139,6 +139,11 @@ export interface FileChangedMessage extends WebSocketMessage {
     change_type: 'created' | 'modified' | 'deleted';
 }
 
+export interface FileChangedBatchMessage extends WebSocketMessage {
+    type: 'file_changed_batch';
+    changes: FileChangedMessage[];
+}
+
 export interface GraphUpdatedMessage extends WebSocketMessage {
     type: 'graph_updated';
     added_count: number;